@@ -2,9 +2,11 @@
 Security utilities for JWT and password hashing
 """
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from passlib.context import CryptContext
 
 from .config import settings
@@ -40,6 +42,18 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def _signing_key() -> Key:
+    """
+    JWT signing key, built once from settings.
+
+    The secret does not change during the process lifetime, so the prepared
+    key object is reused instead of being reconstructed by python-jose on
+    every encode/decode.
+    """
+    return jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+
 def create_access_token(
     data: dict[str, Any], expires_delta: timedelta | None = None
 ) -> str:
@@ -65,7 +79,7 @@ def create_access_token(
     to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc), "type": "access"})
 
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode, _signing_key(), algorithm=settings.JWT_ALGORITHM
     )
 
     return encoded_jwt
@@ -87,7 +101,7 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc), "type": "refresh"})
 
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode, _signing_key(), algorithm=settings.JWT_ALGORITHM
     )
 
     return encoded_jwt
@@ -108,7 +122,7 @@ def decode_token(token: str) -> dict[str, Any]:
     """
     try:
         payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            token, _signing_key(), algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
     except JWTError as e:
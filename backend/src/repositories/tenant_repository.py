@@ -5,7 +5,7 @@ from typing import Any
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -48,6 +48,27 @@ class TenantRepository(BaseRepository[TenantClient]):
         )
         return list(result.scalars().all())
 
+    async def count_active(self) -> int:
+        """Count active tenants"""
+        result = await self.session.execute(
+            select(func.count(TenantClient.id)).where(
+                TenantClient.onboarding_status == OnboardingStatus.ACTIVE
+            )
+        )
+        return result.scalar_one()
+
+    async def exists_active_by_name(self, name: str) -> bool:
+        """Check whether an active tenant with this name exists"""
+        result = await self.session.execute(
+            select(
+                exists().where(
+                    TenantClient.name == name,
+                    TenantClient.onboarding_status == OnboardingStatus.ACTIVE,
+                )
+            )
+        )
+        return result.scalar_one()
+
     async def create_with_app_registration(
         self, tenant_data: dict, app_reg_data: dict
     ) -> TenantClient:
@@ -61,19 +82,14 @@ class TenantRepository(BaseRepository[TenantClient]):
         Returns:
             Created TenantClient with app_registration
         """
-        # Create tenant
+        # Link through the relationship: the FK is resolved during a single
+        # flush and tenant.app_registration is populated in memory, so no
+        # refresh query is needed to load it
         tenant = TenantClient(**tenant_data)
+        tenant.app_registration = TenantAppRegistration(**app_reg_data)
         self.session.add(tenant)
         await self.session.flush()
 
-        # Create app registration
-        app_reg = TenantAppRegistration(tenant_client_id=tenant.id, **app_reg_data)
-        self.session.add(app_reg)
-        await self.session.flush()
-
-        # Refresh to load relationship
-        await self.session.refresh(tenant, ["app_registration"])
-
         logger.info(
             "tenant_with_app_registration_created",
             tenant_id=tenant.id,
@@ -1,32 +1,51 @@
 """
 Encryption service for securing sensitive data (client secrets, etc.)
-Uses Fernet symmetric encryption from cryptography library.
+Uses Fernet symmetric encryption from cryptography library, or AES-256-GCM
+(single authenticated pass, hardware-accelerated by OpenSSL) on request.
 """
+import base64
+import os
+
 import structlog
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 logger = structlog.get_logger(__name__)
 
+SUPPORTED_BACKENDS = ("fernet", "aesgcm")
+AESGCM_NONCE_SIZE = 12
+
 
 class EncryptionService:
     """
     Service for encrypting and decrypting sensitive data.
     Uses Fernet (symmetric encryption) with a key from environment variables.
+    The "aesgcm" backend uses the same 32-byte key for AES-256-GCM; its tokens
+    are not interchangeable with Fernet tokens.
     """
 
-    def __init__(self, encryption_key: str):
+    def __init__(self, encryption_key: str, backend: str = "fernet"):
         """
         Initialize encryption service with Fernet key.
 
         Args:
             encryption_key: Base64-encoded Fernet key from .env
+            backend: "fernet" (default) or "aesgcm"
 
         Raises:
-            ValueError: If encryption key is invalid
+            ValueError: If encryption key or backend is invalid
         """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"Unsupported encryption backend: {backend}")
+
+        self.backend = backend
+        self._aesgcm: AESGCM | None = None
         try:
             self._fernet = Fernet(encryption_key.encode())
-            logger.info("encryption_service_initialized")
+            if backend == "aesgcm":
+                self._aesgcm = AESGCM(base64.urlsafe_b64decode(encryption_key))
+            logger.info("encryption_service_initialized", backend=backend)
         except Exception as e:
             logger.error("encryption_service_init_failed", error=str(e))
             raise ValueError(f"Invalid encryption key: {e}") from e
@@ -39,7 +58,8 @@ class EncryptionService:
             plaintext: String to encrypt
 
         Returns:
-            Base64-encoded encrypted string (Fernet token)
+            Base64-encoded encrypted string (Fernet token, or nonce + AES-GCM
+            ciphertext for the aesgcm backend)
 
         Raises:
             ValueError: If encryption fails
@@ -48,7 +68,12 @@ class EncryptionService:
             raise ValueError("Cannot encrypt empty string")
 
         try:
-            encrypted_bytes = self._fernet.encrypt(plaintext.encode())
+            if self._aesgcm is not None:
+                nonce = os.urandom(AESGCM_NONCE_SIZE)
+                sealed = self._aesgcm.encrypt(nonce, plaintext.encode(), None)
+                encrypted_bytes = base64.urlsafe_b64encode(nonce + sealed)
+            else:
+                encrypted_bytes = self._fernet.encrypt(plaintext.encode())
             encrypted_str = encrypted_bytes.decode()
             logger.debug("string_encrypted", length=len(plaintext))
             return encrypted_str
@@ -58,10 +83,10 @@ class EncryptionService:
 
     def decrypt(self, ciphertext: str) -> str:
         """
-        Decrypt a Fernet-encrypted string.
+        Decrypt a string produced by encrypt().
 
         Args:
-            ciphertext: Base64-encoded encrypted string (Fernet token)
+            ciphertext: Base64-encoded encrypted string (Fernet or AES-GCM token)
 
         Returns:
             Decrypted plaintext string
@@ -73,11 +98,17 @@ class EncryptionService:
             raise ValueError("Cannot decrypt empty string")
 
         try:
-            decrypted_bytes = self._fernet.decrypt(ciphertext.encode())
+            if self._aesgcm is not None:
+                raw = base64.urlsafe_b64decode(ciphertext.encode())
+                decrypted_bytes = self._aesgcm.decrypt(
+                    raw[:AESGCM_NONCE_SIZE], raw[AESGCM_NONCE_SIZE:], None
+                )
+            else:
+                decrypted_bytes = self._fernet.decrypt(ciphertext.encode())
             plaintext = decrypted_bytes.decode()
             logger.debug("string_decrypted", length=len(plaintext))
             return plaintext
-        except InvalidToken as e:
+        except (InvalidToken, InvalidTag) as e:
             logger.error("decryption_failed_invalid_token")
             raise ValueError("Decryption failed: invalid token or wrong key") from e
         except Exception as e:
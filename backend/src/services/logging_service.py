@@ -205,17 +205,13 @@ class LoggingService:
         retention_days = float(days or getattr(settings, "LOG_RETENTION_DAYS", 90) or 90)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-        # Count logs to be deleted
-        count_result = await self.db.execute(
-            select(func.count(AuditLog.id)).where(AuditLog.created_at < cutoff_date)
+        # Delete old logs in one statement, the rowcount gives the purged count
+        result = await self.db.execute(
+            delete(AuditLog).where(AuditLog.created_at < cutoff_date)
         )
-        count = count_result.scalar() or 0
+        count = result.rowcount or 0
 
         if count > 0:
-            # Delete old logs
-            await self.db.execute(
-                delete(AuditLog).where(AuditLog.created_at < cutoff_date)
-            )
             await self.db.commit()
 
             logger.info(
@@ -244,25 +240,23 @@ class LoggingService:
         """
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        base_query = select(AuditLog).where(AuditLog.created_at >= start_date)
+        # Count by level in a single round-trip
+        count_query = (
+            select(AuditLog.level, func.count(AuditLog.id))
+            .where(AuditLog.created_at >= start_date)
+            .group_by(AuditLog.level)
+        )
         if tenant_id:
-            base_query = base_query.where(AuditLog.tenant_id == tenant_id)
+            count_query = count_query.where(AuditLog.tenant_id == tenant_id)
 
-        # Total count
-        total_result = await self.db.execute(
-            select(func.count(AuditLog.id)).where(AuditLog.created_at >= start_date)
-        )
-        total = total_result.scalar() or 0
-
-        # Count by level
-        levels = {}
-        for level in ["debug", "info", "warning", "error", "critical"]:
-            level_result = await self.db.execute(
-                select(func.count(AuditLog.id))
-                .where(AuditLog.created_at >= start_date)
-                .where(AuditLog.level == level)
-            )
-            levels[level] = level_result.scalar() or 0
+        result = await self.db.execute(count_query)
+        counts = {level: count for level, count in result.all()}
+
+        total = sum(counts.values())
+        levels = {
+            level: counts.get(level, 0)
+            for level in ["debug", "info", "warning", "error", "critical"]
+        }
 
         # Error rate
         error_count = levels.get("error", 0) + levels.get("critical", 0)
@@ -2,12 +2,17 @@
 Optimized Pytest configuration for parallel testing with pytest-xdist
 """
 import asyncio
+import hashlib
+import inspect
 import os
 import sys
+from itertools import count
 from typing import AsyncGenerator
+from uuid import UUID, uuid5
 
 import pytest
 import pytest_asyncio
+from cryptography.fernet import Fernet
 from httpx import AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -18,7 +23,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from src.core.config import settings  # noqa: E402
 from src.core.database import get_db  # noqa: E402
-from src.core.security import create_access_token, get_password_hash  # noqa: E402
+from src.core.security import (  # noqa: E402
+    create_access_token,
+    get_password_hash,
+    pwd_context,
+)
 from src.main import app  # noqa: E402
 from src.models.base import Base  # noqa: E402
 
@@ -36,8 +45,18 @@ settings.PARTNER_CLIENT_ID = "00000000-0000-0000-0000-000000000000"
 settings.PARTNER_CLIENT_SECRET = "test-partner-secret"
 settings.PARTNER_TENANT_ID = "00000000-0000-0000-0000-000000000000"
 
-# Test database configuration
-TEST_DB_NAME = "m365_optimizer_test"
+# Test-only: drop bcrypt to its minimum cost factor (production uses passlib's
+# default of 12 rounds). Applied at import time so hashes computed while test
+# modules are collected are cheap too; verification is unaffected since the
+# cost is embedded in each hash.
+pwd_context.update(bcrypt__rounds=4)
+
+# Test database configuration: one database per xdist worker
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+TEST_DB_BASE_NAME = "m365_optimizer_test"
+TEST_DB_NAME = (
+    f"{TEST_DB_BASE_NAME}_{XDIST_WORKER}" if XDIST_WORKER else TEST_DB_BASE_NAME
+)
 TEST_DATABASE_URL = settings.DATABASE_URL.replace("m365_optimizer", TEST_DB_NAME)
 
 # Use test database URL
@@ -52,24 +71,190 @@ def event_loop():
     loop.close()
 
 
+def _schema_fingerprint() -> str:
+    """
+    Hash the DDL generated by the models and the test ENUM bootstrap.
+    Used to name the template database, so any model change gets a fresh one.
+    """
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    dialect = postgresql.dialect()
+    ddl = [inspect.getsource(_create_enum_types)]
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        # Sorted by name: table.indexes is a set
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+        for column in table.columns:
+            if hasattr(column.type, "enums"):
+                ddl.append(f"{column.type.name}={column.type.enums}")
+    return hashlib.sha1("\n".join(ddl).encode()).hexdigest()[:12]
+
+
+def _create_enum_types(connection):
+    """Create every ENUM type used by the models in the optimizer schema."""
+    from sqlalchemy.dialects.postgresql import ENUM
+
+    # Collect all unique ENUM types from the metadata
+    enum_types = {}
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            # Check if column type is a PostgreSQL ENUM
+            if isinstance(column.type, ENUM):
+                enum_name = column.type.name
+                if enum_name not in enum_types:
+                    # Store the ENUM with its values
+                    enum_types[enum_name] = column.type.enums
+
+    # Manually add ENUMs with create_type=False
+    # These are not auto-detected but are required
+    if "snapshot_type" not in enum_types:
+        enum_types["snapshot_type"] = [
+            "license_inventory",
+            "user_inventory",
+            "service_usage",
+            "security_status",
+            "cost_analysis",
+            "optimization_recommendations",
+        ]
+    if "metric_type" not in enum_types:
+        enum_types["metric_type"] = [
+            "license_utilization",
+            "license_cost",
+            "license_savings",
+            "license_efficiency",
+            "active_users",
+            "inactive_users",
+            "disabled_users",
+            "guest_users",
+            "exchange_usage",
+            "sharepoint_usage",
+            "teams_usage",
+            "onedrive_usage",
+            "mfa_coverage",
+            "risk_score",
+            "compliance_score",
+        ]
+    if "licensestatus" not in enum_types:
+        enum_types["licensestatus"] = [
+            "ACTIVE",
+            "INACTIVE",
+            "SUSPENDED",
+            "PENDING",
+        ]
+    if "assignmentsource" not in enum_types:
+        enum_types["assignmentsource"] = [
+            "AUTOMATIC",
+            "MANUAL",
+            "BULK",
+            "API",
+        ]
+
+    # Create each ENUM type in the optimizer schema
+    for enum_name, enum_values in enum_types.items():
+        values_str = ", ".join([f"'{value}'" for value in enum_values])
+        # Create the ENUM type if it doesn't exist
+        connection.execute(
+            text(
+                f"""
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_type t
+                    JOIN pg_namespace n ON t.typnamespace = n.oid
+                    WHERE t.typname = '{enum_name}' AND n.nspname = 'optimizer'
+                ) THEN
+                    CREATE TYPE {enum_name} AS ENUM ({values_str});
+                END IF;
+            END$$;
+        """
+            )
+        )
+
+
+async def _create_schema(engine) -> None:
+    """Create the optimizer schema, ENUM types and all tables."""
+    async with engine.begin() as conn:
+        # Create schema first
+        await conn.execute(text("CREATE SCHEMA IF NOT EXISTS optimizer"))
+
+        # Set search_path so ENUMs are created in the optimizer schema
+        await conn.execute(text("SET search_path TO optimizer, public"))
+
+        # Create all ENUM types first
+        await conn.run_sync(_create_enum_types)
+
+        # Now create all tables (ENUMs already exist)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+# Template database holding the pre-built schema, cloned for each session
+TEST_TEMPLATE_DB_NAME = f"{TEST_DB_BASE_NAME}_tpl_{_schema_fingerprint()}"
+
+
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def setup_test_database():
     """
     Setup test database once per session for parallel testing.
-    This creates a separate test database to avoid conflicts.
+
+    The schema is built once into a template database named after the
+    schema fingerprint; each session then clones it with
+    CREATE DATABASE ... TEMPLATE, which is a cheap file-level copy.
     """
     # Connect to the main database to create test database
     main_engine = create_async_engine(
         settings.DATABASE_URL.replace(TEST_DB_NAME, "m365_optimizer"),
         echo=False,
         isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
     )
 
     try:
         async with main_engine.begin() as conn:
+            # Serialize template creation between xdist workers
+            await conn.execute(
+                text("SELECT pg_advisory_lock(hashtext(:name))"),
+                {"name": TEST_DB_BASE_NAME},
+            )
+            template_exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": TEST_TEMPLATE_DB_NAME},
+            )
+            if not template_exists:
+                # Drop templates left behind by older schema versions
+                stale = await conn.scalars(
+                    text("SELECT datname FROM pg_database WHERE datname LIKE :prefix"),
+                    {"prefix": f"{TEST_DB_BASE_NAME}_tpl_%"},
+                )
+                for name in stale.all():
+                    await conn.execute(text(f"DROP DATABASE IF EXISTS {name}"))
+
+                await conn.execute(text(f"CREATE DATABASE {TEST_TEMPLATE_DB_NAME}"))
+                template_engine = create_async_engine(
+                    settings.DATABASE_URL.replace(TEST_DB_NAME, TEST_TEMPLATE_DB_NAME),
+                    echo=False,
+                    poolclass=NullPool,
+                )
+                try:
+                    await _create_schema(template_engine)
+                except Exception:
+                    await template_engine.dispose()
+                    await conn.execute(
+                        text(f"DROP DATABASE IF EXISTS {TEST_TEMPLATE_DB_NAME}")
+                    )
+                    raise
+                await template_engine.dispose()
+
             # Create test database
             await conn.execute(text(f"DROP DATABASE IF EXISTS {TEST_DB_NAME}"))
-            await conn.execute(text(f"CREATE DATABASE {TEST_DB_NAME}"))
+            await conn.execute(
+                text(f"CREATE DATABASE {TEST_DB_NAME} TEMPLATE {TEST_TEMPLATE_DB_NAME}")
+            )
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:name))"),
+                {"name": TEST_DB_BASE_NAME},
+            )
     except Exception as e:
         print(f"Warning: Could not create test database: {e}")
         # Fallback to using main database with unique schema
@@ -85,6 +270,7 @@ async def setup_test_database():
             settings.DATABASE_URL.replace(TEST_DB_NAME, "m365_optimizer"),
             echo=False,
             isolation_level="AUTOCOMMIT",
+            poolclass=NullPool,
         )
         async with main_engine.begin() as conn:
             await conn.execute(text(f"DROP DATABASE IF EXISTS {TEST_DB_NAME}"))
@@ -94,118 +280,22 @@ async def setup_test_database():
         await main_engine.dispose()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_engine():
+@pytest_asyncio.fixture(scope="session")
+async def db_engine(setup_test_database):
     """
-    Create test database engine for each test function.
-    Uses transaction rollback for isolation instead of schema recreation.
+    Create test database engine once per test session.
+    The schema comes from the template database (see setup_test_database);
+    tests are isolated by transaction rollback (see db_connection and
+    db_session).
     """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         poolclass=NullPool,
+        # Room for every statement compiled across the suite (default: 500)
+        query_cache_size=1200,
     )
 
-    # Setup: Create schema and tables
-    try:
-        async with engine.begin() as conn:
-            # Create schema first
-            await conn.execute(text("CREATE SCHEMA IF NOT EXISTS optimizer"))
-
-            # Set search_path so ENUMs are created in the optimizer schema
-            await conn.execute(text("SET search_path TO optimizer, public"))
-
-            # Extract all ENUM types from SQLAlchemy metadata
-            # This automatically finds all ENUMs defined in models
-            def create_enum_types(connection):
-                from sqlalchemy.dialects.postgresql import ENUM
-
-                # Collect all unique ENUM types from the metadata
-                enum_types = {}
-                for table in Base.metadata.tables.values():
-                    for column in table.columns:
-                        # Check if column type is a PostgreSQL ENUM
-                        if isinstance(column.type, ENUM):
-                            enum_name = column.type.name
-                            if enum_name not in enum_types:
-                                # Store the ENUM with its values
-                                enum_types[enum_name] = column.type.enums
-
-                # Manually add ENUMs with create_type=False
-                # These are not auto-detected but are required
-                if "snapshot_type" not in enum_types:
-                    enum_types["snapshot_type"] = [
-                        "license_inventory",
-                        "user_inventory",
-                        "service_usage",
-                        "security_status",
-                        "cost_analysis",
-                        "optimization_recommendations",
-                    ]
-                if "metric_type" not in enum_types:
-                    enum_types["metric_type"] = [
-                        "license_utilization",
-                        "license_cost",
-                        "license_savings",
-                        "license_efficiency",
-                        "active_users",
-                        "inactive_users",
-                        "disabled_users",
-                        "guest_users",
-                        "exchange_usage",
-                        "sharepoint_usage",
-                        "teams_usage",
-                        "onedrive_usage",
-                        "mfa_coverage",
-                        "risk_score",
-                        "compliance_score",
-                    ]
-                if "licensestatus" not in enum_types:
-                    enum_types["licensestatus"] = [
-                        "ACTIVE",
-                        "INACTIVE",
-                        "SUSPENDED",
-                        "PENDING",
-                    ]
-                if "assignmentsource" not in enum_types:
-                    enum_types["assignmentsource"] = [
-                        "AUTOMATIC",
-                        "MANUAL",
-                        "BULK",
-                        "API",
-                    ]
-
-                # Create each ENUM type in the optimizer schema
-                for enum_name, enum_values in enum_types.items():
-                    values_str = ", ".join([f"'{value}'" for value in enum_values])
-                    # Create the ENUM type if it doesn't exist
-                    connection.execute(
-                        text(
-                            f"""
-                        DO $$
-                        BEGIN
-                            IF NOT EXISTS (
-                                SELECT 1 FROM pg_type t
-                                JOIN pg_namespace n ON t.typnamespace = n.oid
-                                WHERE t.typname = '{enum_name}' AND n.nspname = 'optimizer'
-                            ) THEN
-                                CREATE TYPE {enum_name} AS ENUM ({values_str});
-                            END IF;
-                        END$$;
-                    """
-                        )
-                    )
-
-            # Create all ENUM types first
-            await conn.run_sync(create_enum_types)
-
-            # Now create all tables (ENUMs already exist)
-            await conn.run_sync(Base.metadata.create_all)
-
-    except Exception as e:
-        print(f"Warning: Error during schema creation: {e}")
-        # Continue even if there are errors
-
     yield engine
 
     # Cleanup
@@ -215,26 +305,45 @@ async def db_engine():
         print(f"Warning: Error during engine disposal: {e}")
 
 
+@pytest_asyncio.fixture(scope="session")
+async def db_connection(db_engine):
+    """
+    Single connection shared by the whole test session.
+    It holds an outer transaction that is rolled back at the end, so nothing
+    a test writes is ever committed to the test database.
+    """
+    async with db_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
+
+
 @pytest_asyncio.fixture(scope="function")
-async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
     """
     Create test database session with transaction isolation.
+
+    Each test runs inside a SAVEPOINT on the shared connection: commits
+    issued by the test only release nested SAVEPOINTs, and the test's
+    SAVEPOINT is rolled back on teardown.
     """
+    savepoint = await db_connection.begin_nested()
     async_session_maker = async_sessionmaker(
-        db_engine,
+        bind=db_connection,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
         finally:
             await session.close()
+            if savepoint.is_active:
+                await savepoint.rollback()
 
 
 @pytest_asyncio.fixture
@@ -292,6 +401,31 @@ async def auth_headers(db_session, test_tenant):
     }
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_up_crypto():
+    """
+    Load the bcrypt and OpenSSL backends once, before the first test runs,
+    so their one-time initialization is not billed to whichever test is first.
+    """
+    get_password_hash("warmup")
+    Fernet(Fernet.generate_key()).encrypt(b"warmup")
+
+
+@pytest.fixture(autouse=True)
+def forbid_password_hashing(request, monkeypatch):
+    """
+    Fail tests marked no_password_hash if they run the bcrypt KDF.
+    Guards token-only tests against picking up a hashing fixture by accident.
+    """
+    if request.node.get_closest_marker("no_password_hash") is None:
+        return
+
+    def _fail(*args, **kwargs):
+        pytest.fail("no_password_hash test computed a password hash")
+
+    monkeypatch.setattr(pwd_context, "hash", _fail)
+
+
 @pytest.fixture
 def sample_tenant_data():
     """Sample tenant data for testing."""
@@ -316,6 +450,19 @@ def sample_user_data():
     }
 
 
+@pytest.fixture
+def id_factory(request):
+    """
+    Deterministic unique-ID generator for test rows.
+
+    Returns UUIDv5 strings derived from the test nodeid and a counter: unique
+    across the suite, reproducible between runs, and cheaper than uuid4.
+    """
+    namespace = UUID(int=0)
+    counter = count()
+    return lambda: str(uuid5(namespace, f"{request.node.nodeid}-{next(counter)}"))
+
+
 @pytest_asyncio.fixture
 async def test_tenant(db_session):
     """Create a test tenant for integration tests."""
@@ -335,6 +482,61 @@ async def test_tenant(db_session):
     return tenant
 
 
+@pytest_asyncio.fixture
+async def seed_tenant_user(db_session):
+    """
+    Seed a tenant, and optionally one of its users, in a single round-trip.
+
+    Prerequisite rows are inserted with SQLAlchemy Core: the tenant INSERT is
+    a CTE feeding an INSERT ... SELECT for the user. Returns the ids as a
+    SimpleNamespace(tenant_id, user_id); user_id is None with with_user=False.
+    """
+    from types import SimpleNamespace
+    from uuid import uuid4
+
+    from sqlalchemy import insert, literal, select
+
+    from src.models.tenant import TenantClient
+    from src.models.user import User
+
+    async def _seed(with_user: bool = True) -> SimpleNamespace:
+        tenant_id = uuid4()
+        tenant_insert = insert(TenantClient).values(
+            id=tenant_id,
+            tenant_id=str(uuid4()),
+            name="Test Company",
+            country="FR",
+        )
+
+        if not with_user:
+            await db_session.execute(tenant_insert)
+            return SimpleNamespace(tenant_id=tenant_id, user_id=None)
+
+        user_id = uuid4()
+        tenant_cte = tenant_insert.returning(TenantClient.id).cte("seed_tenant")
+        await db_session.execute(
+            insert(User).from_select(
+                [
+                    "id",
+                    "tenant_client_id",
+                    "graph_id",
+                    "user_principal_name",
+                    "account_enabled",
+                ],
+                select(
+                    literal(user_id),
+                    tenant_cte.c.id,
+                    literal(str(uuid4())),
+                    literal(f"john.doe.{uuid4()}@testcompany.com"),
+                    literal(True),
+                ),
+            )
+        )
+        return SimpleNamespace(tenant_id=tenant_id, user_id=user_id)
+
+    return _seed
+
+
 # Optimized for parallel testing
 # Remove session-wide cleanup that causes conflicts
 @pytest.fixture(scope="session", autouse=True)
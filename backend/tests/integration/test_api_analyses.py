@@ -8,6 +8,7 @@ from httpx import AsyncClient
 
 from src.models.tenant import TenantClient
 from src.models.user import LicenseAssignment
+from src.repositories.user_repository import UserRepository
 
 
 @pytest.mark.asyncio
@@ -234,8 +235,6 @@ async def test_analysis_with_inactive_users(
 ):
     """Test analysis identifies inactive users"""
     # Create an inactive user
-    from src.repositories.user_repository import UserRepository
-
     user_repo = UserRepository(db_session)
 
     user = await user_repo.create(
@@ -8,6 +8,7 @@ import pytest
 from httpx import AsyncClient
 
 from src.models.analysis import Analysis
+from src.models.report import Report
 from src.models.tenant import TenantClient
 
 
@@ -352,8 +353,6 @@ async def test_download_expired_report(
     client: AsyncClient, auth_headers: dict, test_tenant: TenantClient, db_session
 ):
     """Test downloading an expired report"""
-    from src.models.report import Report
-
     # Create an expired report directly in database
     expired_report = Report(
         id=uuid4(),
@@ -440,8 +439,6 @@ async def test_cleanup_expired_reports(
     client: AsyncClient, auth_headers: dict, test_tenant: TenantClient, db_session
 ):
     """Test cleaning up expired reports"""
-    from src.models.report import Report
-
     # Create some expired reports directly in database
     for i in range(3):
         expired_report = Report(
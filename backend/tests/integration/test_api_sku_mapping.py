@@ -8,8 +8,10 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.security import create_access_token
 from src.models.addon_compatibility import AddonCompatibility
 from src.models.microsoft_product import MicrosoftProduct
+from src.models.tenant import TenantClient
 from src.models.user import User
 
 
@@ -19,8 +21,6 @@ class TestSkuMappingAPI:
     @pytest.fixture
     async def admin_user(self, db_session: AsyncSession) -> User:
         """Create admin user for testing"""
-        from src.models.tenant import TenantClient
-
         # Create a tenant first
         tenant = TenantClient(
             tenant_id=str(uuid4()),
@@ -47,8 +47,6 @@ class TestSkuMappingAPI:
     @pytest.fixture
     async def auth_headers(self, admin_user: User, client: AsyncClient, db_session) -> dict:
         """Get authentication headers for admin user"""
-        from src.core.security import create_access_token
-
         # Create a real JWT token for the admin user
         access_token = create_access_token(
             data={
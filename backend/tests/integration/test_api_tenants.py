@@ -1,6 +1,8 @@
 """
 Integration tests for tenant API endpoints
 """
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
 
@@ -23,8 +25,6 @@ class TestTenantsAPI:
     @pytest.mark.asyncio
     async def test_create_tenant(self, client: AsyncClient, auth_headers):
         """Test creating a new tenant"""
-        from uuid import uuid4
-
         new_tenant_id = str(uuid4())
         new_client_id = str(uuid4())
 
@@ -56,8 +56,6 @@ class TestTenantsAPI:
     @pytest.mark.asyncio
     async def test_create_tenant_duplicate(self, client: AsyncClient, auth_headers):
         """Test creating duplicate tenant fails"""
-        from uuid import uuid4
-
         dup_tenant_id = str(uuid4())
         dup_client_id = str(uuid4())
 
@@ -86,8 +84,6 @@ class TestTenantsAPI:
     @pytest.mark.asyncio
     async def test_get_tenant_by_id(self, client: AsyncClient, auth_headers):
         """Test getting tenant by ID"""
-        from uuid import uuid4
-
         get_tenant_id = str(uuid4())
         get_client_id = str(uuid4())
 
@@ -130,8 +126,6 @@ class TestTenantsAPI:
     @pytest.mark.asyncio
     async def test_list_tenants_after_creation(self, client: AsyncClient, auth_headers):
         """Test listing tenants returns created tenants"""
-        from uuid import uuid4
-
         # Create 2 tenants
         for i in range(2):
             tid = str(uuid4())
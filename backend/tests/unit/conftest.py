@@ -0,0 +1,46 @@
+"""
+Shared fixtures for unit tests
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.services.auth_service import AuthService
+
+_real_asyncio_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay, result=None):
+    """asyncio.sleep replacement: still yields to the loop, never waits."""
+    return await _real_asyncio_sleep(0, result)
+
+
+@pytest.fixture(autouse=True)
+def _no_asyncio_sleep(monkeypatch):
+    """Make throttling/backoff sleeps in services instant in unit tests."""
+    monkeypatch.setattr(asyncio, "sleep", _instant_sleep)
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock database session."""
+    db = AsyncMock()
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock()
+    db.delete = AsyncMock()
+    db.add = MagicMock()
+    return db
+
+
+@pytest.fixture(scope="module")
+def fernet_key():
+    """Fernet key shared by the whole module"""
+    return Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def auth_service(db_session):
+    """AuthService bound to the per-test session"""
+    return AuthService(db_session)
@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models import MicrosoftPrice, MicrosoftProduct
 from src.repositories.product_repository import PriceRepository, ProductRepository
 
+pytestmark = pytest.mark.xdist_group("db")
+
 
 @pytest.mark.asyncio
 class TestProductRepository:
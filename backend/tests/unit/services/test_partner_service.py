@@ -2,6 +2,7 @@
 Unit tests for PartnerService
 Tests API calls, pagination, retry logic, and caching
 """
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -75,8 +76,6 @@ class TestPartnerService:
     @pytest.mark.asyncio
     async def test_fetch_pricing_from_cache(self, partner_service, mock_redis):
         """Test pricing retrieved from Redis cache"""
-        import json
-
         cached_data = [{"id": "SKU1", "price": 10.0}]
         mock_redis.get = AsyncMock(return_value=json.dumps(cached_data).encode())
 
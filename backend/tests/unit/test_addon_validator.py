@@ -8,6 +8,16 @@ from uuid import uuid4
 import pytest
 
 from src.models.addon_compatibility import AddonCompatibility
+from src.services.addon_validator import AddonValidator
+
+
+def _empty_result():
+    """Build a fresh empty query result so no mock state leaks between tests"""
+    # Synchronous MagicMock (not AsyncMock): result.scalars().all() is not awaited
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    result.scalar_one_or_none.return_value = None
+    return result
 
 
 class TestAddonValidator:
@@ -17,12 +27,7 @@ class TestAddonValidator:
     def mock_session(self):
         """Mock database session"""
         session = AsyncMock()
-        # Configure execute to return a MagicMock (not AsyncMock) for the result
-        # This ensures result.scalars() is synchronous and returns a mock that has .all()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_result.scalar_one_or_none.return_value = None
-        session.execute.return_value = mock_result
+        session.execute.return_value = _empty_result()
         return session
 
     @pytest.fixture
@@ -38,8 +43,6 @@ class TestAddonValidator:
     @pytest.fixture
     def validator(self, mock_session, mock_addon_repo):
         """Addon validator instance"""
-        from src.services.addon_validator import AddonValidator
-
         # Créer le validator avec le vrai repository mais avec notre mock session
         validator = AddonValidator(mock_session)
         # Remplacer le repo par notre mock
@@ -69,6 +72,13 @@ class TestAddonValidator:
         mapping.expiration_date = None
         return mapping
 
+    @pytest.fixture
+    def mapping_variant(self, request, mock_compatibility_mapping):
+        """Compatibility mapping with the parametrized fields overridden"""
+        for field, value in request.param.items():
+            setattr(mock_compatibility_mapping, field, value)
+        return mock_compatibility_mapping
+
     @pytest.mark.asyncio
     async def test_validate_addon_compatibility_success(
         self, validator, mock_compatibility_mapping
@@ -101,24 +111,6 @@ class TestAddonValidator:
         assert len(errors) == 1
         assert "No compatibility mapping found" in errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_inactive_mapping(
-        self, validator, mock_compatibility_mapping
-    ):
-        """Test validation with inactive mapping"""
-        mock_compatibility_mapping.is_active = False
-        validator.addon_repo.get_specific_mapping = AsyncMock(
-            return_value=mock_compatibility_mapping
-        )
-
-        is_valid, errors = await validator.validate_addon_compatibility(
-            "0001", "0001", 1
-        )
-
-        assert is_valid is False
-        assert len(errors) == 2  # inactive + not available
-        assert any("inactive" in error for error in errors)
-
     @pytest.mark.asyncio
     async def test_validate_addon_compatibility_unavailable_mapping(
         self, validator, mock_compatibility_mapping
@@ -144,55 +136,35 @@ class TestAddonValidator:
         assert "not currently available" in errors[0]
 
     @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_quantity_too_low(
-        self, validator, mock_compatibility_mapping
-    ):
-        """Test validation with quantity below minimum"""
-        mock_compatibility_mapping.min_quantity = 5
-        validator.addon_repo.get_specific_mapping = AsyncMock(
-            return_value=mock_compatibility_mapping
-        )
-
-        is_valid, errors = await validator.validate_addon_compatibility(
-            "0001", "0001", 1
-        )
-
-        assert is_valid is False
-        assert any("below minimum" in error for error in errors)
-
-    @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_quantity_too_high(
-        self, validator, mock_compatibility_mapping
-    ):
-        """Test validation with quantity above maximum"""
-        mock_compatibility_mapping.max_quantity = 10
-        validator.addon_repo.get_specific_mapping = AsyncMock(
-            return_value=mock_compatibility_mapping
-        )
-
-        is_valid, errors = await validator.validate_addon_compatibility(
-            "0001", "0001", 15
-        )
-
-        assert is_valid is False
-        assert any("exceeds maximum" in error for error in errors)
-
-    @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_quantity_multiplier(
-        self, validator, mock_compatibility_mapping
+    @pytest.mark.parametrize(
+        "mapping_variant, quantity, expected_error",
+        [
+            ({"is_active": False}, 1, "inactive"),
+            ({"min_quantity": 5}, 1, "below minimum"),
+            ({"max_quantity": 10}, 15, "exceeds maximum"),
+            ({"quantity_multiplier": 5}, 3, "multiple of"),
+        ],
+        ids=[
+            "inactive",
+            "quantity_too_low",
+            "quantity_too_high",
+            "quantity_multiplier",
+        ],
+        indirect=["mapping_variant"],
+    )
+    async def test_validate_addon_compatibility_invalid_mapping(
+        self, validator, mapping_variant, quantity, expected_error
     ):
-        """Test validation with quantity not matching multiplier"""
-        mock_compatibility_mapping.quantity_multiplier = 5
-        validator.addon_repo.get_specific_mapping = AsyncMock(
-            return_value=mock_compatibility_mapping
-        )
+        """Test validation with an inactive mapping or violated quantity rules"""
+        validator.addon_repo.get_specific_mapping.return_value = mapping_variant
 
         is_valid, errors = await validator.validate_addon_compatibility(
-            "0001", "0001", 3
+            "0001", "0001", quantity
         )
 
         assert is_valid is False
-        assert any("multiple of" in error for error in errors)
+        assert any(expected_error in error for error in errors)
+        assert any("Service type incompatibility" in error for error in errors)
 
     @pytest.mark.asyncio
     async def test_validate_addon_compatibility_invalid_quantity(
@@ -365,8 +337,9 @@ class TestAddonValidator:
     ):
         """Test bulk validation with some invalid add-ons"""
         # First call returns valid mapping, second call returns None (invalid)
-        validator.addon_repo.get_specific_mapping = AsyncMock(
-            side_effect=[mock_compatibility_mapping, None]
+        mappings = iter([mock_compatibility_mapping, None])
+        validator.addon_repo.get_specific_mapping.side_effect = (
+            lambda *args, **kwargs: next(mappings)
         )
         # Mock async methods for the valid one
         validator._validate_business_rules = AsyncMock(return_value=(True, []))
@@ -11,6 +11,12 @@ from src.models.usage_metrics import UsageMetrics
 from src.models.user import User
 from src.services.analysis_service import AnalysisService
 
+# Monthly license costs shared by the recommendation tests
+COST_8 = Decimal("8.00")
+COST_10 = Decimal("10.00")
+COST_15 = Decimal("15.00")
+COST_20 = Decimal("20.00")
+
 
 @pytest.mark.asyncio
 async def test_calculate_usage_scores_empty(db_session):
@@ -80,7 +86,7 @@ async def test_generate_recommendation_inactive_user(db_session):
     }
 
     current_sku = "06ebc4ee-1bb5-47dd-8120-11324bc54e06"  # E5
-    current_cost = Decimal("10.00")
+    current_cost = COST_10
 
     recommendation = await service._generate_recommendation(
         user, usage_scores, current_sku, current_cost
@@ -116,7 +122,7 @@ async def test_generate_recommendation_low_usage(db_session):
     }
 
     current_sku = "05e9a617-0261-4cee-bb44-138d3ef5d965"  # E3
-    current_cost = Decimal("10.00")
+    current_cost = COST_10
 
     recommendation = await service._generate_recommendation(
         user, usage_scores, current_sku, current_cost
@@ -150,7 +156,7 @@ async def test_generate_recommendation_downgrade_e5_to_e3(db_session):
     }
 
     current_sku = "06ebc4ee-1bb5-47dd-8120-11324bc54e06"  # E5
-    current_cost = Decimal("20.00")
+    current_cost = COST_20
 
     recommendation = await service._generate_recommendation(
         user, usage_scores, current_sku, current_cost
@@ -188,7 +194,7 @@ async def test_generate_recommendation_downgrade_e3_to_e1(db_session):
     }
 
     current_sku = "05e9a617-0261-4cee-bb44-138d3ef5d965"  # E3
-    current_cost = Decimal("15.00")
+    current_cost = COST_15
 
     recommendation = await service._generate_recommendation(
         user, usage_scores, current_sku, current_cost
@@ -226,7 +232,7 @@ async def test_generate_recommendation_no_change(db_session):
     }
 
     current_sku = "18181a46-0d4e-45cd-891e-60aabd171b4e"  # E1
-    current_cost = Decimal("8.00")
+    current_cost = COST_8
 
     recommendation = await service._generate_recommendation(
         user, usage_scores, current_sku, current_cost
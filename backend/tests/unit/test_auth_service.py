@@ -1,9 +1,11 @@
 """
 Unit tests for auth_service (authentication service)
 """
-from uuid import uuid4
+from types import SimpleNamespace
+from uuid import UUID
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import get_password_hash
@@ -11,42 +13,82 @@ from src.models.tenant import TenantClient
 from src.models.user import User
 from src.services.auth_service import AuthenticationError, AuthService
 
-
-@pytest.mark.unit
-class TestAuthService:
-    """Tests for AuthService"""
-
-    @pytest.mark.asyncio
-    async def test_authenticate_user_success(self, db_session: AsyncSession):
-        """Test successful user authentication"""
-        # Create a tenant
+pytestmark = pytest.mark.xdist_group("crypto")
+
+# Hash once at import: bcrypt dominates the runtime of this module, and
+# get_password_hash itself is covered by tests/unit/test_security.py
+_SHARED_PASSWORD = "SecurePassword123!"
+_SHARED_HASH = get_password_hash(_SHARED_PASSWORD)
+
+# Deterministic identifiers: seeded rows only live in a rolled-back transaction
+_TENANT_ID = UUID(int=1)
+_ENABLED_USER_GRAPH_ID = UUID(int=2)
+_DISABLED_USER_GRAPH_ID = UUID(int=3)
+_TOKEN_USER_ID = UUID(int=4)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_user(db_connection):
+    """
+    Seed a tenant with an enabled and a disabled user.
+
+    The seed is inserted once per module inside a SAVEPOINT on the shared
+    test connection, which is rolled back when the module is done. Being
+    module-scoped, it is set up before any test's db_session, which is
+    nested inside it and sees the seeded rows.
+    """
+    savepoint = await db_connection.begin_nested()
+
+    async with AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
         tenant = TenantClient(
-            tenant_id=str(uuid4()),
+            tenant_id=str(_TENANT_ID),
             name="Test Tenant",
             country="FR",
             default_language="fr",
             onboarding_status="active",
         )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        # Create a user with password
-        password = "SecurePassword123!"
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"user_{uuid4()}@test.com",
+        enabled = User(
+            graph_id=str(_ENABLED_USER_GRAPH_ID),
+            tenant=tenant,
+            user_principal_name="enabled_user@test.com",
             display_name="Test User",
             account_enabled=True,
-            password_hash=get_password_hash(password),
+            password_hash=_SHARED_HASH,
+        )
+        disabled = User(
+            graph_id=str(_DISABLED_USER_GRAPH_ID),
+            tenant=tenant,
+            user_principal_name="disabled_user@test.com",
+            account_enabled=False,
+            password_hash=_SHARED_HASH,
         )
-        db_session.add(user)
-        await db_session.commit()
+        # FKs are resolved from the relationships during a single flush
+        session.add_all([tenant, enabled, disabled])
+        await session.commit()
+
+    yield SimpleNamespace(tenant=tenant, enabled=enabled, disabled=disabled)
+
+    await savepoint.rollback()
+
+
+@pytest.mark.unit
+class TestAuthService:
+    """Tests for AuthService"""
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_success(
+        self, auth_service: AuthService, seeded_user
+    ):
+        """Test successful user authentication"""
+        user = seeded_user.enabled
 
         # Test authentication
-        auth_service = AuthService(db_session)
         user_data = await auth_service.authenticate_user(
-            user.user_principal_name, password
+            user.user_principal_name, _SHARED_PASSWORD
         )
 
         assert user_data is not None
@@ -55,84 +97,47 @@ class TestAuthService:
         assert "id" in user_data
 
     @pytest.mark.asyncio
-    async def test_authenticate_user_wrong_password(self, db_session: AsyncSession):
+    async def test_authenticate_user_wrong_password(
+        self, auth_service: AuthService, seeded_user
+    ):
         """Test authentication with wrong password"""
-        # Create a tenant
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Tenant",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        # Create a user
-        password = "SecurePassword123!"
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"user_{uuid4()}@test.com",
-            account_enabled=True,
-            password_hash=get_password_hash(password),
-        )
-        db_session.add(user)
-        await db_session.commit()
+        user = seeded_user.enabled
 
         # Test with wrong password
-        auth_service = AuthService(db_session)
         with pytest.raises(AuthenticationError, match="Invalid credentials"):
             await auth_service.authenticate_user(
                 user.user_principal_name, "WrongPassword!"
             )
 
     @pytest.mark.asyncio
-    async def test_authenticate_user_not_found(self, db_session: AsyncSession):
+    async def test_authenticate_user_not_found(self, auth_service: AuthService):
         """Test authentication with non-existent user"""
-        auth_service = AuthService(db_session)
-
         with pytest.raises(AuthenticationError, match="Invalid credentials"):
             await auth_service.authenticate_user("nonexistent@test.com", "password")
 
     @pytest.mark.asyncio
-    async def test_authenticate_disabled_account(self, db_session: AsyncSession):
+    async def test_authenticate_disabled_account(
+        self, auth_service: AuthService, seeded_user
+    ):
         """Test authentication with disabled account"""
-        # Create a tenant
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Tenant",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        # Create a disabled user
-        password = "SecurePassword123!"
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"user_{uuid4()}@test.com",
-            account_enabled=False,
-            password_hash=get_password_hash(password),
-        )
-        db_session.add(user)
-        await db_session.commit()
+        user = seeded_user.disabled
 
         # Test authentication
-        auth_service = AuthService(db_session)
         with pytest.raises(AuthenticationError, match="Account is disabled"):
-            await auth_service.authenticate_user(user.user_principal_name, password)
+            await auth_service.authenticate_user(
+                user.user_principal_name, _SHARED_PASSWORD
+            )
 
     @pytest.mark.asyncio
-    async def test_create_tokens(self, db_session: AsyncSession):
+    async def test_create_tokens(self, auth_service: AuthService):
         """Test token creation"""
         user_data = {
-            "id": uuid4(),
+            "id": _TOKEN_USER_ID,
             "user_principal_name": "user@test.com",
-            "tenant_client_id": uuid4(),
+            "tenant_client_id": _TENANT_ID,
             "display_name": "Test User",
         }
 
-        auth_service = AuthService(db_session)
         tokens = await auth_service.create_tokens(user_data)
 
         assert tokens.access_token is not None
@@ -141,35 +146,20 @@ class TestAuthService:
         assert tokens.expires_in > 0
 
     @pytest.mark.asyncio
-    async def test_refresh_access_token_success(self, db_session: AsyncSession):
+    @pytest.mark.no_password_hash
+    async def test_refresh_access_token_success(
+        self, auth_service: AuthService, seeded_user
+    ):
         """Test successful token refresh"""
-        # Create a tenant
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Tenant",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        # Create a user
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"user_{uuid4()}@test.com",
-            account_enabled=True,
-        )
-        db_session.add(user)
-        await db_session.commit()
+        user = seeded_user.enabled
 
         # Create tokens
         user_data = {
             "id": user.id,
             "user_principal_name": user.user_principal_name,
-            "tenant_client_id": tenant.id,
+            "tenant_client_id": seeded_user.tenant.id,
             "display_name": "Test User",
         }
-        auth_service = AuthService(db_session)
         tokens = await auth_service.create_tokens(user_data)
 
         # Refresh the token
@@ -180,44 +170,28 @@ class TestAuthService:
         assert new_token_data["expires_in"] > 0
 
     @pytest.mark.asyncio
-    async def test_refresh_with_invalid_token(self, db_session: AsyncSession):
+    async def test_refresh_with_invalid_token(self, auth_service: AuthService):
         """Test refresh with invalid token"""
-        auth_service = AuthService(db_session)
-
         with pytest.raises(
             AuthenticationError, match="Invalid or expired refresh token"
         ):
             await auth_service.refresh_access_token("invalid.token.here")
 
     @pytest.mark.asyncio
-    async def test_refresh_with_access_token_fails(self, db_session: AsyncSession):
+    @pytest.mark.no_password_hash
+    async def test_refresh_with_access_token_fails(
+        self, auth_service: AuthService, seeded_user
+    ):
         """Test that refresh fails when using access token instead of refresh token"""
-        # Create a tenant and user
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Tenant",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"user_{uuid4()}@test.com",
-            account_enabled=True,
-        )
-        db_session.add(user)
-        await db_session.commit()
+        user = seeded_user.enabled
 
         # Create tokens
         user_data = {
             "id": user.id,
             "user_principal_name": user.user_principal_name,
-            "tenant_client_id": tenant.id,
+            "tenant_client_id": seeded_user.tenant.id,
             "display_name": "Test User",
         }
-        auth_service = AuthService(db_session)
         tokens = await auth_service.create_tokens(user_data)
 
         # Try to refresh with access token (should fail)
@@ -6,15 +6,39 @@ from cryptography.fernet import Fernet
 
 from src.services.encryption_service import EncryptionService
 
+pytestmark = pytest.mark.xdist_group("crypto")
+
+# Round-trip plaintexts, built once at import (long texts: 1KB, 10KB, 100KB)
+ROUND_TRIP_PLAINTEXTS = {
+    "ascii": "my-super-secret-client-secret",
+    "unicode": "Clé secrète avec des accents: é è à ç 中文",
+    "special": "!@#$%^&*()_+-=[]{}|;':,.<>?/~`",
+    "json": '{"client_id": "123", "client_secret": "abc"}',
+    "long_1KB": "A" * 1024,
+    "long_10KB": "A" * 10_000,
+    "long_100KB": "A" * 100_000,
+}
+
+
+@pytest.fixture(scope="module")
+def fernet_key_2():
+    """Second Fernet key, distinct from fernet_key"""
+    return Fernet.generate_key().decode()
+
+
+@pytest.fixture(scope="module", params=["fernet", "aesgcm"])
+def service(request, fernet_key):
+    """EncryptionService built once per backend for the whole module"""
+    return EncryptionService(fernet_key, backend=request.param)
+
 
 @pytest.mark.unit
 class TestEncryptionService:
     """Tests for EncryptionService"""
 
-    def test_initialization_with_valid_key(self):
+    def test_initialization_with_valid_key(self, fernet_key):
         """Test service initialization with valid Fernet key"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
+        service = EncryptionService(fernet_key)
 
         assert service is not None
         assert service._fernet is not None
@@ -24,119 +48,73 @@ class TestEncryptionService:
         with pytest.raises(ValueError, match="Invalid encryption key"):
             EncryptionService("invalid-key-format")
 
-    def test_encrypt_decrypt_round_trip(self):
-        """Test encrypt/decrypt round trip"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
+    def test_initialization_with_unsupported_backend(self, fernet_key):
+        """Test service initialization with unknown backend"""
+        with pytest.raises(ValueError, match="Unsupported encryption backend"):
+            EncryptionService(fernet_key, backend="rot13")
+
+    def test_backends_are_not_interchangeable(self, fernet_key):
+        """Test that AES-GCM tokens cannot be read by the Fernet backend"""
+        fernet_service = EncryptionService(fernet_key)
+        aesgcm_service = EncryptionService(fernet_key, backend="aesgcm")
+
+        encrypted = aesgcm_service.encrypt("secret")
 
-        original_text = "my-super-secret-client-secret"
-        encrypted = service.encrypt(original_text)
+        with pytest.raises(ValueError, match="Decryption failed"):
+            fernet_service.decrypt(encrypted)
+
+    @pytest.mark.parametrize(
+        "plaintext",
+        list(ROUND_TRIP_PLAINTEXTS.values()),
+        ids=list(ROUND_TRIP_PLAINTEXTS),
+    )
+    def test_encrypt_decrypt_round_trip(self, service, plaintext):
+        """Test encrypt/decrypt round trip (unicode, special chars, JSON, long text)"""
+        encrypted = service.encrypt(plaintext)
         decrypted = service.decrypt(encrypted)
 
-        assert decrypted == original_text
-        assert encrypted != original_text  # Ensure it was actually encrypted
+        assert decrypted == plaintext
+        assert encrypted != plaintext  # Ensure it was actually encrypted
         assert isinstance(encrypted, str)
 
-    def test_encrypt_empty_string(self):
+    def test_encrypt_empty_string(self, service):
         """Test encrypting empty string raises error"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
         with pytest.raises(ValueError, match="Cannot encrypt empty string"):
             service.encrypt("")
 
-    def test_encrypt_unicode_characters(self):
-        """Test encrypting text with unicode characters"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
-        original_text = "Clé secrète avec des accents: é è à ç 中文"
-        encrypted = service.encrypt(original_text)
-        decrypted = service.decrypt(encrypted)
-
-        assert decrypted == original_text
-
-    def test_encrypt_long_text(self):
-        """Test encrypting long text"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
-        original_text = "A" * 10000  # 10KB text
-        encrypted = service.encrypt(original_text)
-        decrypted = service.decrypt(encrypted)
-
-        assert decrypted == original_text
-
-    def test_decrypt_with_wrong_key(self):
+    def test_decrypt_with_wrong_key(self, service, fernet_key_2):
         """Test decryption with wrong key fails"""
-        key1 = Fernet.generate_key().decode()
-        key2 = Fernet.generate_key().decode()
+        other_service = EncryptionService(fernet_key_2, backend=service.backend)
 
-        service1 = EncryptionService(key1)
-        service2 = EncryptionService(key2)
-
-        encrypted = service1.encrypt("secret")
+        encrypted = service.encrypt("secret")
 
         with pytest.raises(ValueError, match="Decryption failed"):
-            service2.decrypt(encrypted)
+            other_service.decrypt(encrypted)
 
-    def test_decrypt_invalid_token(self):
+    def test_decrypt_invalid_token(self, service):
         """Test decryption of invalid encrypted data"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
         with pytest.raises(ValueError, match="Decryption failed"):
             service.decrypt("not-valid-encrypted-data")
 
-    def test_encrypt_none_value(self):
+    def test_encrypt_none_value(self, service):
         """Test encrypting None value raises error"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
         with pytest.raises(ValueError, match="Cannot encrypt empty string"):
             service.encrypt(None)
 
-    def test_decrypt_none_value(self):
+    def test_decrypt_none_value(self, service):
         """Test decrypting None value raises error"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
         with pytest.raises(ValueError, match="Cannot decrypt empty string"):
             service.decrypt(None)
 
-    def test_different_encryptions_same_plaintext(self):
-        """Test that same plaintext produces different ciphertexts (timestamp-based)"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
+    def test_different_encryptions_same_plaintext(self, service):
+        """Test that same plaintext produces different ciphertexts (timestamp/nonce)"""
         original_text = "secret-data"
         encrypted1 = service.encrypt(original_text)
         encrypted2 = service.encrypt(original_text)
 
-        # Fernet includes timestamp, so same plaintext should produce different ciphertexts
+        # Fernet includes a timestamp and IV, AES-GCM a random nonce, so the
+        # same plaintext should produce different ciphertexts
         assert encrypted1 != encrypted2
         # But both should decrypt to same plaintext
         assert service.decrypt(encrypted1) == original_text
         assert service.decrypt(encrypted2) == original_text
-
-    def test_encrypt_special_characters(self):
-        """Test encrypting text with special characters"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
-        original_text = "!@#$%^&*()_+-=[]{}|;':,.<>?/~`"
-        encrypted = service.encrypt(original_text)
-        decrypted = service.decrypt(encrypted)
-
-        assert decrypted == original_text
-
-    def test_encrypt_json_string(self):
-        """Test encrypting JSON-like string"""
-        key = Fernet.generate_key().decode()
-        service = EncryptionService(key)
-
-        original_text = '{"client_id": "123", "client_secret": "abc"}'
-        encrypted = service.encrypt(original_text)
-        decrypted = service.decrypt(encrypted)
-
-        assert decrypted == original_text
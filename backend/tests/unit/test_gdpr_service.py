@@ -3,27 +3,34 @@ Unit tests for GdprService (LOT 10)
 Tests consent management, data export, and right to erasure.
 """
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
+import pytest_asyncio
 
 from src.services.gdpr_service import GdprService
 
+pytestmark = pytest.mark.xdist_group("pdf")
+
+# Deterministic identifiers shared by all tests (the database is mocked)
+TENANT_ID = UUID(int=1)
+USER_ID = UUID(int=2)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def registry_pdf():
+    """
+    Registry PDF rendered once per session: ReportLab rendering is the
+    slowest step of this module and the document does not depend on the DB.
+    """
+    return await GdprService(MagicMock()).generate_registry_pdf()
+
 
 class TestGdprService:
     """Tests for GdprService."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.delete = AsyncMock()
-        db.add = MagicMock()
-        return db
-
     @pytest.fixture
     def service(self, mock_db):
         """Create a GdprService instance."""
@@ -36,11 +43,10 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_record_consent_success(self, service, mock_db):
         """Test successful consent recording."""
-        tenant_id = uuid4()
-        mock_tenant = MagicMock()
-        mock_tenant.id = tenant_id
-        mock_tenant.gdpr_consent = False
-        mock_tenant.gdpr_consent_date = None
+        tenant_id = TENANT_ID
+        mock_tenant = SimpleNamespace(
+            id=tenant_id, gdpr_consent=False, gdpr_consent_date=None
+        )
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_tenant
@@ -56,7 +62,7 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_record_consent_tenant_not_found(self, service, mock_db):
         """Test consent recording when tenant not found."""
-        tenant_id = uuid4()
+        tenant_id = TENANT_ID
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -68,11 +74,12 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_revoke_consent(self, service, mock_db):
         """Test consent revocation."""
-        tenant_id = uuid4()
-        mock_tenant = MagicMock()
-        mock_tenant.id = tenant_id
-        mock_tenant.gdpr_consent = True
-        mock_tenant.gdpr_consent_date = datetime.now(timezone.utc)
+        tenant_id = TENANT_ID
+        mock_tenant = SimpleNamespace(
+            id=tenant_id,
+            gdpr_consent=True,
+            gdpr_consent_date=datetime.now(timezone.utc),
+        )
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_tenant
@@ -86,7 +93,7 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_check_consent_true(self, service, mock_db):
         """Test consent check when consent given."""
-        tenant_id = uuid4()
+        tenant_id = TENANT_ID
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = True
@@ -99,7 +106,7 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_check_consent_false(self, service, mock_db):
         """Test consent check when consent not given."""
-        tenant_id = uuid4()
+        tenant_id = TENANT_ID
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = False
@@ -116,35 +123,30 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_export_user_data_success(self, service, mock_db):
         """Test successful user data export."""
-        user_id = uuid4()
+        user_id = USER_ID
 
         # Mock user
-        mock_user = MagicMock()
-        mock_user.id = user_id
-        mock_user.graph_id = "graph-123"
-        mock_user.user_principal_name = "test@example.com"
-        mock_user.display_name = "Test User"
-        mock_user.department = "IT"
-        mock_user.job_title = "Developer"
-        mock_user.office_location = "HQ"
-        mock_user.account_enabled = True
-        mock_user.member_of_groups = ["Group1"]
-        mock_user.created_at = datetime.now(timezone.utc)
-        mock_user.updated_at = datetime.now(timezone.utc)
-
-        # Setup mock returns for different queries
-        call_count = 0
-        def mock_execute(query):
-            nonlocal call_count
-            result = MagicMock()
-            if call_count == 0:  # User query
-                result.scalar_one_or_none.return_value = mock_user
-            else:  # License, usage, recommendations queries
-                result.scalars.return_value.all.return_value = []
-            call_count += 1
-            return result
-
-        mock_db.execute = AsyncMock(side_effect=mock_execute)
+        mock_user = SimpleNamespace(
+            id=user_id,
+            graph_id="graph-123",
+            user_principal_name="test@example.com",
+            display_name="Test User",
+            department="IT",
+            job_title="Developer",
+            office_location="HQ",
+            account_enabled=True,
+            member_of_groups=["Group1"],
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+
+        # Setup mock returns for the user, then license, usage and
+        # recommendations queries
+        user_result = SimpleNamespace(scalar_one_or_none=lambda: mock_user)
+        empty_result = SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+        mock_db.execute = AsyncMock(
+            side_effect=[user_result, empty_result, empty_result, empty_result]
+        )
 
         result = await service.export_user_data(user_id)
 
@@ -154,11 +156,13 @@ class TestGdprService:
         assert "license_assignments" in result
         assert "usage_metrics" in result
         assert "recommendations" in result
+        # One round-trip for the user, then one per related table
+        assert mock_db.execute.await_count == 4
 
     @pytest.mark.asyncio
     async def test_export_user_data_not_found(self, service, mock_db):
         """Test user data export when user not found."""
-        user_id = uuid4()
+        user_id = USER_ID
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -167,6 +171,9 @@ class TestGdprService:
         with pytest.raises(ValueError, match="not found"):
             await service.export_user_data(user_id)
 
+        # Related tables are not queried for an unknown user
+        assert mock_db.execute.await_count == 1
+
     # ============================================
     # Data Deletion Tests
     # ============================================
@@ -174,10 +181,9 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_delete_user_data_full_delete(self, service, mock_db):
         """Test full user data deletion."""
-        user_id = uuid4()
+        user_id = USER_ID
 
-        mock_user = MagicMock()
-        mock_user.id = user_id
+        mock_user = SimpleNamespace(id=user_id)
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_user
@@ -192,12 +198,13 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_delete_user_data_anonymize(self, service, mock_db):
         """Test user data anonymization."""
-        user_id = uuid4()
+        user_id = USER_ID
 
-        mock_user = MagicMock()
-        mock_user.id = user_id
-        mock_user.user_principal_name = "test@example.com"
-        mock_user.display_name = "Test User"
+        mock_user = SimpleNamespace(
+            id=user_id,
+            user_principal_name="test@example.com",
+            display_name="Test User",
+        )
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_user
@@ -212,7 +219,7 @@ class TestGdprService:
     @pytest.mark.asyncio
     async def test_delete_user_data_not_found(self, service, mock_db):
         """Test user deletion when user not found."""
-        user_id = uuid4()
+        user_id = USER_ID
 
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -225,12 +232,15 @@ class TestGdprService:
     # Registry PDF Tests
     # ============================================
 
-    @pytest.mark.asyncio
-    async def test_generate_registry_pdf(self, service):
+    def test_generate_registry_pdf(self, registry_pdf):
         """Test GDPR registry PDF generation."""
-        pdf_content = await service.generate_registry_pdf()
+        pdf_content = registry_pdf
 
         assert pdf_content is not None
         assert len(pdf_content) > 0
         # PDF magic bytes
         assert pdf_content[:4] == b"%PDF"
+
+    def test_generate_registry_pdf_is_complete(self, registry_pdf):
+        """Test GDPR registry PDF is a complete document."""
+        assert registry_pdf.rstrip().endswith(b"%%EOF")
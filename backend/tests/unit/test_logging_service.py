@@ -3,7 +3,8 @@ Unit tests for LoggingService (LOT 10)
 Tests log storage, retrieval, and purging.
 """
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
@@ -11,18 +12,23 @@ import pytest
 from src.services.logging_service import LoggingService
 
 
+def _fake_result(scalar_value=None, all_value=None):
+    """Lightweight stand-in for a SQLAlchemy Result (no MagicMock plumbing)"""
+    return SimpleNamespace(
+        scalar=lambda: scalar_value,
+        scalar_one_or_none=lambda: scalar_value,
+        scalars=lambda: SimpleNamespace(all=lambda: all_value),
+        all=lambda: all_value,
+    )
+
+
+# Read-only log rows shared by the retrieval tests (sliced as needed)
+_STUB_LOGS = [SimpleNamespace(id=uuid4()) for _ in range(20)]
+
+
 class TestLoggingService:
     """Tests for LoggingService."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.add = MagicMock()
-        return db
-
     @pytest.fixture
     def service(self, mock_db):
         """Create a LoggingService instance."""
@@ -86,35 +92,27 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_get_logs_no_filters(self, service, mock_db):
         """Test log retrieval without filters."""
-        mock_logs = [MagicMock() for _ in range(5)]
-
-        # Mock count query
-        count_result = MagicMock()
-        count_result.scalar.return_value = 100
+        mock_logs = _STUB_LOGS[:5]
 
-        # Mock data query
-        data_result = MagicMock()
-        data_result.scalars.return_value.all.return_value = mock_logs
-
-        mock_db.execute = AsyncMock(side_effect=[count_result, data_result])
+        # Count query, then data query
+        mock_db.execute = AsyncMock(
+            side_effect=[_fake_result(100), _fake_result(all_value=mock_logs)]
+        )
 
         logs, total = await service.get_logs()
 
         assert len(logs) == 5
         assert total == 100
+        assert mock_db.execute.await_count == 2
 
     @pytest.mark.asyncio
     async def test_get_logs_with_level_filter(self, service, mock_db):
         """Test log retrieval with level filter."""
-        mock_logs = [MagicMock()]
-
-        count_result = MagicMock()
-        count_result.scalar.return_value = 1
+        mock_logs = _STUB_LOGS[:1]
 
-        data_result = MagicMock()
-        data_result.scalars.return_value.all.return_value = mock_logs
-
-        mock_db.execute = AsyncMock(side_effect=[count_result, data_result])
+        mock_db.execute = AsyncMock(
+            side_effect=[_fake_result(1), _fake_result(all_value=mock_logs)]
+        )
 
         logs, total = await service.get_logs(level="error")
 
@@ -127,13 +125,9 @@ class TestLoggingService:
         start_date = datetime.now(timezone.utc) - timedelta(days=7)
         end_date = datetime.now(timezone.utc)
 
-        count_result = MagicMock()
-        count_result.scalar.return_value = 50
-
-        data_result = MagicMock()
-        data_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute = AsyncMock(side_effect=[count_result, data_result])
+        mock_db.execute = AsyncMock(
+            side_effect=[_fake_result(50), _fake_result(all_value=[])]
+        )
 
         logs, total = await service.get_logs(
             start_date=start_date,
@@ -145,13 +139,11 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_get_logs_pagination(self, service, mock_db):
         """Test log retrieval with pagination."""
-        count_result = MagicMock()
-        count_result.scalar.return_value = 200
-
-        data_result = MagicMock()
-        data_result.scalars.return_value.all.return_value = [MagicMock() for _ in range(20)]
+        mock_logs = _STUB_LOGS[:20]
 
-        mock_db.execute = AsyncMock(side_effect=[count_result, data_result])
+        mock_db.execute = AsyncMock(
+            side_effect=[_fake_result(200), _fake_result(all_value=mock_logs)]
+        )
 
         logs, total = await service.get_logs(limit=20, offset=40)
 
@@ -161,13 +153,10 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_get_log_by_id_found(self, service, mock_db):
         """Test retrieving a specific log by ID."""
-        log_id = uuid4()
-        mock_log = MagicMock()
-        mock_log.id = log_id
+        mock_log = _STUB_LOGS[0]
+        log_id = mock_log.id
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_log
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _fake_result(mock_log)
 
         result = await service.get_log_by_id(log_id)
 
@@ -179,9 +168,7 @@ class TestLoggingService:
         """Test retrieving a non-existent log."""
         log_id = uuid4()
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _fake_result(None)
 
         result = await service.get_log_by_id(log_id)
 
@@ -194,23 +181,18 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_purge_old_logs_default_retention(self, service, mock_db):
         """Test purging logs with default retention (90 days)."""
-        count_result = MagicMock()
-        count_result.scalar.return_value = 1000
-
-        mock_db.execute = AsyncMock(return_value=count_result)
+        mock_db.execute = AsyncMock(return_value=SimpleNamespace(rowcount=1000))
 
         deleted = await service.purge_old_logs()
 
         assert deleted == 1000
+        mock_db.execute.assert_awaited_once()
         mock_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_purge_old_logs_custom_retention(self, service, mock_db):
         """Test purging logs with custom retention period."""
-        count_result = MagicMock()
-        count_result.scalar.return_value = 500
-
-        mock_db.execute = AsyncMock(return_value=count_result)
+        mock_db.execute = AsyncMock(return_value=SimpleNamespace(rowcount=500))
 
         deleted = await service.purge_old_logs(days=30)
 
@@ -219,10 +201,7 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_purge_old_logs_no_logs_to_delete(self, service, mock_db):
         """Test purging when no old logs exist."""
-        count_result = MagicMock()
-        count_result.scalar.return_value = 0
-
-        mock_db.execute = AsyncMock(return_value=count_result)
+        mock_db.execute = AsyncMock(return_value=SimpleNamespace(rowcount=0))
 
         deleted = await service.purge_old_logs()
 
@@ -236,22 +215,18 @@ class TestLoggingService:
     @pytest.mark.asyncio
     async def test_get_log_statistics(self, service, mock_db):
         """Test log statistics retrieval."""
-        # Mock different query results
-        def create_mock_result(value):
-            result = MagicMock()
-            result.scalar.return_value = value
-            return result
-
-        results = [
-            create_mock_result(1000),  # Total
-            create_mock_result(100),   # Debug
-            create_mock_result(500),   # Info
-            create_mock_result(200),   # Warning
-            create_mock_result(150),   # Error
-            create_mock_result(50),    # Critical
-        ]
-
-        mock_db.execute = AsyncMock(side_effect=results)
+        # One grouped query: (level, count) rows
+        mock_db.execute = AsyncMock(
+            return_value=_fake_result(
+                all_value=[
+                    ("debug", 100),
+                    ("info", 500),
+                    ("warning", 200),
+                    ("error", 150),
+                    ("critical", 50),
+                ]
+            )
+        )
 
         stats = await service.get_log_statistics(days=7)
 
@@ -261,18 +236,22 @@ class TestLoggingService:
         assert stats["by_level"]["info"] == 500
         assert stats["error_count"] == 200  # error + critical
         assert stats["error_rate_percent"] == 20.0  # 200/1000 * 100
+        assert mock_db.execute.await_count == 1
 
     @pytest.mark.asyncio
     async def test_get_log_statistics_with_tenant_filter(self, service, mock_db):
         """Test log statistics with tenant filter."""
         tenant_id = uuid4()
 
-        results = [MagicMock() for _ in range(6)]
-        for r in results:
-            r.scalar.return_value = 10
-
-        mock_db.execute = AsyncMock(side_effect=results)
+        mock_db.execute = AsyncMock(
+            return_value=_fake_result(all_value=[("info", 10), ("error", 10)])
+        )
 
         stats = await service.get_log_statistics(tenant_id=tenant_id, days=30)
 
         assert stats["period_days"] == 30
+        assert stats["total_logs"] == 20
+        assert stats["by_level"]["debug"] == 0
+
+        statement = mock_db.execute.await_args.args[0]
+        assert "tenant_id" in str(statement)
@@ -2,8 +2,10 @@
 Unit tests for middleware components
 """
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from starlette.datastructures import Headers
 
 from src.core.middleware import (
     AuditLogMiddleware,
@@ -12,38 +14,71 @@ from src.core.middleware import (
     get_user_identifier,
 )
 
+# Body returned by the test endpoint
+_TEST_PAYLOAD = {"message": "test", "value": 42}
 
-@pytest.fixture
-def app():
-    """Create a test FastAPI app with middleware"""
+
+def _build_app(*middleware) -> FastAPI:
+    """Create a test FastAPI app with the given middleware"""
     app = FastAPI()
 
     @app.get("/test")
     async def test_endpoint():
-        return {"message": "test"}
+        return _TEST_PAYLOAD
+
+    for middleware_class in middleware:
+        app.add_middleware(middleware_class)
 
     return app
 
 
-@pytest.fixture
-def client_with_security_headers(app):
+def _client(app: FastAPI) -> AsyncClient:
+    """Async client calling the app in-process through its ASGI interface"""
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+# Clients are module-scoped: tests only send requests, and each client has its
+# own app so middleware never accumulates across fixtures.
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client_with_security_headers():
     """Create test client with security headers middleware"""
-    app.add_middleware(SecurityHeadersMiddleware)
-    return TestClient(app)
+    async with _client(_build_app(SecurityHeadersMiddleware)) as client:
+        yield client
 
 
-@pytest.fixture
-def client_with_request_id(app):
+@pytest_asyncio.fixture(scope="module")
+async def client_with_request_id():
     """Create test client with request ID middleware"""
-    app.add_middleware(RequestIDMiddleware)
-    return TestClient(app)
+    async with _client(_build_app(RequestIDMiddleware)) as client:
+        yield client
 
 
-@pytest.fixture
-def client_with_audit_log(app):
+@pytest_asyncio.fixture(scope="module")
+async def client_with_audit_log():
     """Create test client with audit log middleware"""
-    app.add_middleware(AuditLogMiddleware)
-    return TestClient(app)
+    async with _client(_build_app(AuditLogMiddleware)) as client:
+        yield client
+
+
+# Middleware combinations exercised together; each stack gets one app/client
+_MIDDLEWARE_STACKS = [
+    (RequestIDMiddleware,),
+    (RequestIDMiddleware, SecurityHeadersMiddleware),
+    (RequestIDMiddleware, SecurityHeadersMiddleware, AuditLogMiddleware),
+]
+
+
+@pytest_asyncio.fixture(
+    scope="module",
+    params=_MIDDLEWARE_STACKS,
+    ids=lambda stack: "+".join(m.__name__ for m in stack),
+)
+async def middleware_stack_client(request):
+    """Create test client per middleware stack, yields (client, stack)"""
+    async with _client(_build_app(*request.param)) as client:
+        yield client, request.param
 
 
 # ============================================
@@ -51,9 +86,10 @@ def client_with_audit_log(app):
 # ============================================
 
 
-def test_security_headers_present(client_with_security_headers):
+@pytest.mark.asyncio
+async def test_security_headers_present(client_with_security_headers):
     """Test that all security headers are present in response"""
-    response = client_with_security_headers.get("/test")
+    response = await client_with_security_headers.get("/test")
 
     assert response.status_code == 200
 
@@ -66,9 +102,10 @@ def test_security_headers_present(client_with_security_headers):
     assert "Permissions-Policy" in response.headers
 
 
-def test_security_headers_csp_policy(client_with_security_headers):
+@pytest.mark.asyncio
+async def test_security_headers_csp_policy(client_with_security_headers):
     """Test Content Security Policy is strict"""
-    response = client_with_security_headers.get("/test")
+    response = await client_with_security_headers.get("/test")
 
     csp = response.headers["Content-Security-Policy"]
     assert "default-src 'self'" in csp
@@ -80,9 +117,10 @@ def test_security_headers_csp_policy(client_with_security_headers):
 # ============================================
 
 
-def test_request_id_generated(client_with_request_id):
+@pytest.mark.asyncio
+async def test_request_id_generated(client_with_request_id):
     """Test that request ID is generated if not provided"""
-    response = client_with_request_id.get("/test")
+    response = await client_with_request_id.get("/test")
 
     assert response.status_code == 200
     assert "X-Request-ID" in response.headers
@@ -92,11 +130,14 @@ def test_request_id_generated(client_with_request_id):
     assert len(request_id) == 36  # UUID length with hyphens
 
 
-def test_request_id_preserved(client_with_request_id):
+@pytest.mark.asyncio
+async def test_request_id_preserved(client_with_request_id):
     """Test that provided request ID is preserved"""
     custom_id = "custom-request-id-12345"
 
-    response = client_with_request_id.get("/test", headers={"X-Request-ID": custom_id})
+    response = await client_with_request_id.get(
+        "/test", headers={"X-Request-ID": custom_id}
+    )
 
     assert response.status_code == 200
     assert response.headers["X-Request-ID"] == custom_id
@@ -107,9 +148,10 @@ def test_request_id_preserved(client_with_request_id):
 # ============================================
 
 
-def test_audit_log_middleware_success(client_with_audit_log, caplog):
+@pytest.mark.asyncio
+async def test_audit_log_middleware_success(client_with_audit_log, caplog):
     """Test audit log middleware logs successful requests"""
-    response = client_with_audit_log.get("/test")
+    response = await client_with_audit_log.get("/test")
 
     assert response.status_code == 200
 
@@ -118,9 +160,10 @@ def test_audit_log_middleware_success(client_with_audit_log, caplog):
     # This is a simplified version
 
 
-def test_audit_log_middleware_captures_method_and_path(client_with_audit_log):
+@pytest.mark.asyncio
+async def test_audit_log_middleware_captures_method_and_path(client_with_audit_log):
     """Test that audit log captures HTTP method and path"""
-    response = client_with_audit_log.post("/test", json={"data": "test"})
+    response = await client_with_audit_log.post("/test", json={"data": "test"})
 
     # Middleware should handle all methods
     # Response status depends on endpoint implementation
@@ -138,9 +181,6 @@ def test_audit_log_middleware_captures_method_and_path(client_with_audit_log):
 async def test_get_user_identifier_ip_fallback():
     """Test user identifier falls back to IP when no user"""
     # Create mock request without user
-    from fastapi import Request
-    from starlette.datastructures import Headers
-
     scope = {
         "type": "http",
         "method": "GET",
@@ -163,45 +203,27 @@ async def test_get_user_identifier_ip_fallback():
 # ============================================
 
 
-def test_all_middleware_together():
-    """Test that all middleware work together without conflicts"""
-    app = FastAPI()
-
-    @app.get("/test")
-    async def test_endpoint():
-        return {"message": "test"}
-
-    # Add all middleware
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(AuditLogMiddleware)
-
-    client = TestClient(app)
-    response = client.get("/test")
+@pytest.mark.asyncio
+async def test_middleware_stack_together(middleware_stack_client):
+    """Test that stacked middleware work together without conflicts"""
+    client, stack = middleware_stack_client
+    response = await client.get("/test")
 
     assert response.status_code == 200
 
-    # Check that both middleware functions worked
-    assert "X-Request-ID" in response.headers
-    assert "X-Frame-Options" in response.headers
-    assert response.headers["X-Frame-Options"] == "DENY"
+    # Each middleware in the stack did its job, and only those
+    assert ("X-Request-ID" in response.headers) == (RequestIDMiddleware in stack)
+    if SecurityHeadersMiddleware in stack:
+        assert response.headers["X-Frame-Options"] == "DENY"
+    else:
+        assert "X-Frame-Options" not in response.headers
 
 
-def test_middleware_preserves_response_content():
+@pytest.mark.asyncio
+async def test_middleware_preserves_response_content(middleware_stack_client):
     """Test that middleware doesn't alter response content"""
-    app = FastAPI()
-
-    expected_data = {"message": "test", "value": 42}
-
-    @app.get("/test")
-    async def test_endpoint():
-        return expected_data
-
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    client = TestClient(app)
-    response = client.get("/test")
+    client, _ = middleware_stack_client
+    response = await client.get("/test")
 
     assert response.status_code == 200
-    assert response.json() == expected_data
+    assert response.json() == _TEST_PAYLOAD
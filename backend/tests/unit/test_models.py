@@ -1,9 +1,11 @@
 """
 Unit tests for database models
 """
-from uuid import uuid4
+from itertools import count
+from uuid import UUID
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from src.models.tenant import (
     ConsentStatus,
@@ -13,6 +15,17 @@ from src.models.tenant import (
 )
 from src.models.user import AssignmentSource, LicenseAssignment, LicenseStatus, User
 
+pytestmark = pytest.mark.xdist_group("db")
+
+# Deterministic, distinct identifiers: rows only live in a rolled-back
+# transaction, so uniqueness within the module is all that is needed
+_ids = count(1)
+
+
+def _id() -> str:
+    """Next identifier from the module's counter, as a UUID string"""
+    return str(UUID(int=next(_ids)))
+
 
 @pytest.mark.unit
 class TestTenantClientModel:
@@ -22,7 +35,7 @@ class TestTenantClientModel:
     async def test_create_tenant_client(self, db_session):
         """Test creating a tenant client"""
         tenant = TenantClient(
-            tenant_id=str(uuid4()),
+            tenant_id=_id(),
             name="Test Company",
             country="FR",
             default_language="fr",
@@ -31,7 +44,6 @@ class TestTenantClientModel:
 
         db_session.add(tenant)
         await db_session.commit()
-        await db_session.refresh(tenant)
 
         assert tenant.id is not None
         assert tenant.name == "Test Company"
@@ -42,7 +54,7 @@ class TestTenantClientModel:
     @pytest.mark.asyncio
     async def test_tenant_unique_tenant_id(self, db_session):
         """Test that tenant_id must be unique"""
-        tenant_id = str(uuid4())
+        tenant_id = _id()
 
         tenant1 = TenantClient(
             tenant_id=tenant_id,
@@ -60,9 +72,8 @@ class TestTenantClientModel:
         )
         db_session.add(tenant2)
 
-        with pytest.raises(Exception):  # IntegrityError
+        with pytest.raises(IntegrityError):
             await db_session.commit()
-        await db_session.rollback()
 
 
 @pytest.mark.unit
@@ -74,7 +85,7 @@ class TestTenantAppRegistrationModel:
         """Test creating an app registration"""
         # Create tenant first
         tenant = TenantClient(
-            tenant_id=str(uuid4()),
+            tenant_id=_id(),
             name="Test Company",
             country="FR",
         )
@@ -84,7 +95,7 @@ class TestTenantAppRegistrationModel:
         # Create app registration
         app_reg = TenantAppRegistration(
             tenant_client_id=tenant.id,
-            client_id=str(uuid4()),
+            client_id=_id(),
             client_secret_encrypted="test-secret",
             authority_url="https://login.microsoftonline.com/test",
             scopes=["User.Read.All", "Directory.Read.All"],
@@ -93,7 +104,6 @@ class TestTenantAppRegistrationModel:
 
         db_session.add(app_reg)
         await db_session.commit()
-        await db_session.refresh(app_reg)
 
         assert app_reg.id is not None
         assert app_reg.client_id is not None
@@ -104,14 +114,14 @@ class TestTenantAppRegistrationModel:
     async def test_app_registration_relationship(self, db_session):
         """Test relationship between tenant and app registration"""
         tenant = TenantClient(
-            tenant_id=str(uuid4()),
+            tenant_id=_id(),
             name="Test Company",
             country="FR",
         )
         db_session.add(tenant)
         await db_session.flush()
 
-        client_id = str(uuid4())
+        client_id = _id()
         app_reg = TenantAppRegistration(
             tenant_client_id=tenant.id,
             client_id=client_id,
@@ -134,22 +144,16 @@ class TestUserModel:
     """Test User model"""
 
     @pytest.mark.asyncio
-    async def test_create_user(self, db_session):
+    async def test_create_user(self, db_session, seed_tenant_user):
         """Test creating a user"""
         # Create tenant first
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
+        seed = await seed_tenant_user(with_user=False)
 
         # Create user
         user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"john.doe.{uuid4()}@testcompany.com",
+            graph_id=_id(),
+            tenant_client_id=seed.tenant_id,
+            user_principal_name=f"john.doe.{_id()}@testcompany.com",
             display_name="John Doe",
             account_enabled=True,
             department="IT",
@@ -158,7 +162,6 @@ class TestUserModel:
 
         db_session.add(user)
         await db_session.commit()
-        await db_session.refresh(user)
 
         assert user.id is not None
         assert user.graph_id is not None
@@ -171,30 +174,15 @@ class TestLicenseAssignmentModel:
     """Test LicenseAssignment model"""
 
     @pytest.mark.asyncio
-    async def test_create_license_assignment(self, db_session):
+    async def test_create_license_assignment(self, db_session, seed_tenant_user):
         """Test creating a license assignment"""
         # Setup tenant and user
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"john.doe.{uuid4()}@testcompany.com",
-            display_name="John Doe",
-        )
-        db_session.add(user)
-        await db_session.flush()
+        seed = await seed_tenant_user()
 
         # Create license assignment
-        sku_id = str(uuid4())
+        sku_id = _id()
         license = LicenseAssignment(
-            user_id=user.id,
+            user_id=seed.user_id,
             sku_id=sku_id,
             status=LicenseStatus.ACTIVE,
             source=AssignmentSource.MANUAL,
@@ -202,42 +190,26 @@ class TestLicenseAssignmentModel:
 
         db_session.add(license)
         await db_session.commit()
-        await db_session.refresh(license)
 
         assert license.id is not None
         assert license.sku_id == sku_id
         assert license.status == LicenseStatus.ACTIVE
 
     @pytest.mark.asyncio
-    async def test_license_unique_constraint(self, db_session):
+    async def test_license_unique_constraint(self, db_session, seed_tenant_user):
         """Test unique constraint on user_id + sku_id"""
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
-        user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"john.doe.{uuid4()}@testcompany.com",
-        )
-        db_session.add(user)
-        await db_session.flush()
+        seed = await seed_tenant_user()
 
-        sku_id = str(uuid4())
+        sku_id = _id()
 
         # First license
-        license1 = LicenseAssignment(user_id=user.id, sku_id=sku_id)
+        license1 = LicenseAssignment(user_id=seed.user_id, sku_id=sku_id)
         db_session.add(license1)
         await db_session.commit()
 
         # Try to add duplicate
-        license2 = LicenseAssignment(user_id=user.id, sku_id=sku_id)
+        license2 = LicenseAssignment(user_id=seed.user_id, sku_id=sku_id)
         db_session.add(license2)
 
-        with pytest.raises(Exception):  # IntegrityError
+        with pytest.raises(IntegrityError):
             await db_session.commit()
-        await db_session.rollback()
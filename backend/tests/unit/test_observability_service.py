@@ -13,29 +13,43 @@ from src.services.observability_service import (
     get_observability_service,
 )
 
+# Root path for disk metrics on this OS, resolved once at import
+_DISK_PATH = "C:\\" if platform.system() == "Windows" else "/"
+
+
+@pytest.fixture(scope="module")
+def service():
+    """ObservabilityService shared by the module (tests only read from it)."""
+    return ObservabilityService()
+
+
+@pytest.fixture(scope="module")
+def all_metrics(service):
+    """
+    Metrics collected once per module: get_cpu_metrics samples for 0.1s,
+    so the per-section tests assert against this snapshot.
+    """
+    return service.get_all_metrics()
+
 
 class TestObservabilityService:
     """Test suite for ObservabilityService."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.service = ObservabilityService()
-
-    def test_initialization(self):
+    def test_initialization(self, service):
         """Test service initialization."""
-        assert self.service is not None
-        assert self.service._start_time > 0
+        assert service is not None
+        assert service._start_time > 0
 
-    def test_uptime_seconds(self):
+    def test_uptime_seconds(self, service):
         """Test uptime calculation."""
-        uptime = self.service.uptime_seconds
+        uptime = service.uptime_seconds
         assert uptime >= 0
         assert isinstance(uptime, float)
 
     @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
-    def test_get_cpu_metrics(self):
+    def test_get_cpu_metrics(self, all_metrics):
         """Test CPU metrics collection."""
-        metrics = self.service.get_cpu_metrics()
+        metrics = all_metrics["cpu"]
 
         assert "percent" in metrics
         assert isinstance(metrics["percent"], (int, float))
@@ -48,9 +62,9 @@ class TestObservabilityService:
             assert metrics["count_logical"] >= 1
 
     @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
-    def test_get_memory_metrics(self):
+    def test_get_memory_metrics(self, all_metrics):
         """Test memory metrics collection."""
-        metrics = self.service.get_memory_metrics()
+        metrics = all_metrics["memory"]
 
         assert "total_bytes" in metrics
         assert "available_bytes" in metrics
@@ -62,11 +76,9 @@ class TestObservabilityService:
             assert 0 <= metrics["percent"] <= 100
 
     @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
-    def test_get_disk_metrics(self):
+    def test_get_disk_metrics(self, service):
         """Test disk metrics collection."""
-        # Use appropriate path for the OS
-        path = "C:\\" if platform.system() == "Windows" else "/"
-        metrics = self.service.get_disk_metrics(path)
+        metrics = service.get_disk_metrics(_DISK_PATH)
 
         assert "path" in metrics
 
@@ -76,9 +88,9 @@ class TestObservabilityService:
             assert 0 <= metrics["percent"] <= 100
 
     @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
-    def test_get_network_metrics(self):
+    def test_get_network_metrics(self, all_metrics):
         """Test network metrics collection."""
-        metrics = self.service.get_network_metrics()
+        metrics = all_metrics["network"]
 
         if "error" not in metrics:
             assert "bytes_sent" in metrics
@@ -87,9 +99,9 @@ class TestObservabilityService:
             assert metrics["bytes_recv"] >= 0
 
     @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
-    def test_get_process_metrics(self):
+    def test_get_process_metrics(self, all_metrics):
         """Test process metrics collection."""
-        metrics = self.service.get_process_metrics()
+        metrics = all_metrics["process"]
 
         if "error" not in metrics:
             assert "pid" in metrics
@@ -97,9 +109,9 @@ class TestObservabilityService:
             assert "memory_rss_bytes" in metrics
             assert "num_threads" in metrics
 
-    def test_get_system_info(self):
+    def test_get_system_info(self, service):
         """Test system info collection."""
-        info = self.service.get_system_info()
+        info = service.get_system_info()
 
         assert "platform" in info
         assert "platform_release" in info
@@ -109,9 +121,9 @@ class TestObservabilityService:
         assert info["platform"] in ["Windows", "Linux", "Darwin"]
         assert info["python_version"]  # Non-empty string
 
-    def test_get_all_metrics(self):
+    def test_get_all_metrics(self, all_metrics):
         """Test comprehensive metrics collection."""
-        metrics = self.service.get_all_metrics()
+        metrics = all_metrics
 
         assert "timestamp" in metrics
         assert "uptime_seconds" in metrics
@@ -136,49 +148,27 @@ class TestObservabilityService:
         assert service1 is service2
 
 
+@patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
 class TestObservabilityServiceWithoutPsutil:
     """Test observability service behavior when psutil is not available."""
 
-    @patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
-    def test_cpu_metrics_without_psutil(self):
-        """Test CPU metrics returns error when psutil unavailable."""
-        service = ObservabilityService()
-        metrics = service.get_cpu_metrics()
-
-        assert "error" in metrics
-        assert metrics["percent"] == 0
-
-    @patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
-    def test_memory_metrics_without_psutil(self):
-        """Test memory metrics returns error when psutil unavailable."""
-        service = ObservabilityService()
-        metrics = service.get_memory_metrics()
-
-        assert "error" in metrics
-
-    @patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
-    def test_disk_metrics_without_psutil(self):
-        """Test disk metrics returns error when psutil unavailable."""
-        service = ObservabilityService()
-        metrics = service.get_disk_metrics()
-
-        assert "error" in metrics
-
-    @patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
-    def test_network_metrics_without_psutil(self):
-        """Test network metrics returns error when psutil unavailable."""
-        service = ObservabilityService()
-        metrics = service.get_network_metrics()
-
-        assert "error" in metrics
-
-    @patch('src.services.observability_service.PSUTIL_AVAILABLE', False)
-    def test_process_metrics_without_psutil(self):
-        """Test process metrics returns error when psutil unavailable."""
-        service = ObservabilityService()
-        metrics = service.get_process_metrics()
+    @pytest.mark.parametrize(
+        "method, expected",
+        [
+            ("get_cpu_metrics", {"percent": 0}),
+            ("get_memory_metrics", {}),
+            ("get_disk_metrics", {}),
+            ("get_network_metrics", {}),
+            ("get_process_metrics", {}),
+        ],
+    )
+    def test_metrics_without_psutil(self, method, expected):
+        """Test each metrics section returns an error when psutil is unavailable."""
+        metrics = getattr(ObservabilityService(), method)()
 
         assert "error" in metrics
+        for key, value in expected.items():
+            assert metrics[key] == value
 
 
 class TestObservabilityServiceErrorHandling:
@@ -4,24 +4,30 @@ Unit tests for repositories
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.models.tenant import OnboardingStatus, TenantClient
 from src.models.user import User
 from src.repositories.tenant_repository import TenantRepository
 from src.repositories.user_repository import UserRepository
 
+pytestmark = pytest.mark.xdist_group("db")
+
 
 @pytest.mark.unit
 class TestTenantRepository:
     """Test TenantRepository"""
 
     @pytest.mark.asyncio
-    async def test_create_tenant(self, db_session):
+    async def test_create_tenant(self, db_session, id_factory):
         """Test creating a tenant via repository"""
         repo = TenantRepository(db_session)
 
         tenant = await repo.create(
-            tenant_id=str(uuid4()),
+            tenant_id=id_factory(),
             name="Test Company",
             country="FR",
             default_language="fr",
@@ -31,11 +37,15 @@ class TestTenantRepository:
         assert tenant.name == "Test Company"
 
     @pytest.mark.asyncio
-    async def test_get_by_tenant_id(self, db_session):
+    @pytest.mark.parametrize(
+        "tenant_id",
+        [str(uuid4()), "12345678-1234-1234-1234-123456789012"],
+        ids=["random", "fixed"],
+    )
+    async def test_get_by_tenant_id(self, db_session, tenant_id):
         """Test getting tenant by Azure AD tenant ID"""
         repo = TenantRepository(db_session)
 
-        tenant_id = str(uuid4())
         created_tenant = await repo.create(
             tenant_id=tenant_id,
             name="Test Company",
@@ -51,51 +61,49 @@ class TestTenantRepository:
         assert retrieved.name == "Test Company"
 
     @pytest.mark.asyncio
-    async def test_get_active_tenants(self, db_session):
+    async def test_get_active_tenants(self, db_session, id_factory):
         """Test getting only active tenants"""
         repo = TenantRepository(db_session)
 
-        # Create active tenant
-        await repo.create(
-            tenant_id=str(uuid4()),
+        # Create one active and one pending tenant in a single flush
+        active = TenantClient(
+            tenant_id=id_factory(),
             name="Active Company",
             country="FR",
             onboarding_status=OnboardingStatus.ACTIVE,
         )
-
-        # Create pending tenant
-        await repo.create(
-            tenant_id=str(uuid4()),
+        pending = TenantClient(
+            tenant_id=id_factory(),
             name="Pending Company",
             country="US",
             onboarding_status=OnboardingStatus.PENDING,
         )
-
+        db_session.add_all([active, pending])
         await db_session.commit()
 
         active_tenants = await repo.get_active_tenants()
 
-        # We assert that we have at least 1 active tenant.
-        # Other tests might have created active tenants, so exact count check is risky in parallel exec
-        assert len(active_tenants) >= 1
-        # Check if our created tenant is in the list
-        names = [t.name for t in active_tenants]
-        assert "Active Company" in names
-        assert "Pending Company" not in names
+        # Each test runs in its own rolled-back transaction on a per-worker
+        # database, so only the tenants created above are visible
+        assert len(active_tenants) == 1
+        assert active_tenants[0].name == "Active Company"
+        assert await repo.count_active() == 1
+        assert await repo.exists_active_by_name("Active Company") is True
+        assert await repo.exists_active_by_name("Pending Company") is False
 
     @pytest.mark.asyncio
-    async def test_create_with_app_registration(self, db_session):
+    async def test_create_with_app_registration(self, db_session, id_factory):
         """Test creating tenant with app registration"""
         repo = TenantRepository(db_session)
 
         tenant_data = {
-            "tenant_id": str(uuid4()),
+            "tenant_id": id_factory(),
             "name": "Test Company",
             "country": "FR",
         }
 
         app_reg_data = {
-            "client_id": str(uuid4()),
+            "client_id": id_factory(),
             "client_secret_encrypted": "test-secret",
             "authority_url": "https://login.microsoftonline.com/test",
             "scopes": ["User.Read.All"],
@@ -113,23 +121,42 @@ class TestTenantRepository:
 class TestUserRepository:
     """Test UserRepository"""
 
+    @pytest_asyncio.fixture(scope="class")
+    async def seed_tenant(self, db_connection):
+        """
+        Parent tenant shared by the class, inserted once.
+
+        Seeded in a SAVEPOINT on the shared test connection and rolled back
+        when the class is done; each test's db_session nests inside it.
+        """
+        savepoint = await db_connection.begin_nested()
+
+        async with AsyncSession(
+            bind=db_connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            tenant = TenantClient(
+                tenant_id=str(uuid4()),
+                name="Test Company",
+                country="FR",
+            )
+            session.add(tenant)
+            await session.commit()
+
+        yield tenant.id
+
+        await savepoint.rollback()
+
     @pytest.mark.asyncio
-    async def test_upsert_user_create(self, db_session):
+    async def test_upsert_user_create(self, db_session, seed_tenant, id_factory):
         """Test upserting a new user"""
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
         repo = UserRepository(db_session)
 
         user = await repo.upsert_user(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"john.doe.{uuid4()}@test.com",
+            graph_id=id_factory(),
+            tenant_client_id=seed_tenant,
+            user_principal_name=f"john.doe.{id_factory()}@test.com",
             display_name="John Doe",
         )
 
@@ -137,33 +164,25 @@ class TestUserRepository:
         assert user.display_name == "John Doe"
 
     @pytest.mark.asyncio
-    async def test_upsert_user_update(self, db_session):
+    async def test_upsert_user_update(self, db_session, seed_tenant, id_factory):
         """Test upserting an existing user"""
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
         repo = UserRepository(db_session)
-        graph_id = str(uuid4())
-        upn = f"john.doe.{uuid4()}@test.com"
+        graph_id = id_factory()
+        upn = f"john.doe.{id_factory()}@test.com"
 
         # Create user
         user1 = await repo.upsert_user(
             graph_id=graph_id,
-            tenant_client_id=tenant.id,
+            tenant_client_id=seed_tenant,
             user_principal_name=upn,
             display_name="John Doe",
         )
-        await db_session.commit()
+        await db_session.flush()
 
         # Update same user
         user2 = await repo.upsert_user(
             graph_id=graph_id,
-            tenant_client_id=tenant.id,
+            tenant_client_id=seed_tenant,
             user_principal_name=upn,
             display_name="John Doe Updated",
             department="IT",
@@ -175,20 +194,12 @@ class TestUserRepository:
         assert user2.department == "IT"
 
     @pytest.mark.asyncio
-    async def test_sync_licenses(self, db_session):
+    async def test_sync_licenses(self, db_session, seed_tenant, id_factory):
         """Test syncing licenses (replace all)"""
-        tenant = TenantClient(
-            tenant_id=str(uuid4()),
-            name="Test Company",
-            country="FR",
-        )
-        db_session.add(tenant)
-        await db_session.flush()
-
         user = User(
-            graph_id=str(uuid4()),
-            tenant_client_id=tenant.id,
-            user_principal_name=f"john.doe.{uuid4()}@test.com",
+            graph_id=id_factory(),
+            tenant_client_id=seed_tenant,
+            user_principal_name=f"john.doe.{id_factory()}@test.com",
         )
         db_session.add(user)
         await db_session.flush()
@@ -197,24 +208,29 @@ class TestUserRepository:
 
         # Initial licenses
         licenses1 = [
-            {"sku_id": str(uuid4()), "status": "active"},
-            {"sku_id": str(uuid4()), "status": "active"},
+            {"sku_id": id_factory(), "status": "active"},
+            {"sku_id": id_factory(), "status": "active"},
         ]
 
-        await repo.sync_licenses(user.id, licenses1)
+        synced = await repo.sync_licenses(user.id, licenses1)
         await db_session.commit()
 
-        await db_session.refresh(user, ["license_assignments"])
-        assert len(user.license_assignments) == 2
+        assert len(synced) == 2
 
         # Update licenses (should replace)
         licenses2 = [
-            {"sku_id": str(uuid4()), "status": "active"},
+            {"sku_id": id_factory(), "status": "active"},
         ]
 
         await repo.sync_licenses(user.id, licenses2)
         await db_session.commit()
 
-        await db_session.refresh(user, ["license_assignments"])
+        # Load the persisted collection eagerly with the user
+        result = await db_session.execute(
+            select(User)
+            .options(selectinload(User.license_assignments))
+            .where(User.id == user.id)
+        )
+        user = result.scalar_one()
         assert len(user.license_assignments) == 1
         assert user.license_assignments[0].sku_id == licenses2[0]["sku_id"]
@@ -15,6 +15,14 @@ from src.core.security import (
     verify_token_type,
 )
 
+pytestmark = pytest.mark.xdist_group("crypto")
+
+
+def _issue(data: dict, **kwargs) -> tuple[str, dict]:
+    """Create an access token and return it with its decoded payload."""
+    token = create_access_token(data, **kwargs)
+    return token, decode_token(token)
+
 
 class TestPasswordHashing:
     """Tests for password hashing functions"""
@@ -57,6 +65,11 @@ class TestPasswordHashing:
 class TestJWTTokens:
     """Tests for JWT token creation and verification"""
 
+    @pytest.fixture(scope="class")
+    def access_token_and_payload(self):
+        """Access token for a common payload, signed and decoded once per class."""
+        return _issue({"sub": "user-id-123", "email": "user@test.com"})
+
     def test_create_access_token(self):
         """Test access token creation"""
         data = {"sub": "user-id-123", "email": "user@test.com"}
@@ -75,12 +88,9 @@ class TestJWTTokens:
         assert isinstance(token, str)
         assert len(token) > 0
 
-    def test_decode_valid_token(self):
+    def test_decode_valid_token(self, access_token_and_payload):
         """Test decoding a valid token"""
-        data = {"sub": "user-id-123", "email": "user@test.com"}
-        token = create_access_token(data)
-
-        payload = decode_token(token)
+        _, payload = access_token_and_payload
 
         assert payload is not None
         assert payload["sub"] == "user-id-123"
@@ -96,11 +106,9 @@ class TestJWTTokens:
         with pytest.raises(JWTError):
             decode_token(invalid_token)
 
-    def test_token_expiration_in_payload(self):
+    def test_token_expiration_in_payload(self, access_token_and_payload):
         """Test that token has expiration time"""
-        data = {"sub": "user-id-123"}
-        token = create_access_token(data)
-        payload = decode_token(token)
+        _, payload = access_token_and_payload
 
         exp = datetime.fromtimestamp(payload["exp"], timezone.utc)
         now = datetime.now(timezone.utc)
@@ -111,8 +119,7 @@ class TestJWTTokens:
         """Test token with custom expiration"""
         data = {"sub": "user-id-123"}
         custom_expiration = timedelta(minutes=5)
-        token = create_access_token(data, expires_delta=custom_expiration)
-        payload = decode_token(token)
+        _, payload = _issue(data, expires_delta=custom_expiration)
 
         exp = datetime.fromtimestamp(payload["exp"], timezone.utc)
         iat = datetime.fromtimestamp(payload["iat"], timezone.utc)
@@ -121,11 +128,9 @@ class TestJWTTokens:
         diff = (exp - iat).total_seconds()
         assert 290 < diff < 310  # Allow 10 seconds margin
 
-    def test_verify_access_token_type(self):
+    def test_verify_access_token_type(self, access_token_and_payload):
         """Test verifying access token type"""
-        data = {"sub": "user-id-123"}
-        token = create_access_token(data)
-        payload = decode_token(token)
+        _, payload = access_token_and_payload
 
         assert verify_token_type(payload, "access") is True
         assert verify_token_type(payload, "refresh") is False
@@ -146,9 +151,32 @@ class TestJWTTokens:
             "email": "user@test.com",
             "tenants": ["tenant-id-1", "tenant-id-2"],
         }
-        token = create_access_token(data)
-        payload = decode_token(token)
+        _, payload = _issue(data)
 
         assert payload["sub"] == "user-id-123"
         assert payload["email"] == "user@test.com"
         assert payload["tenants"] == ["tenant-id-1", "tenant-id-2"]
+
+
+@pytest.mark.benchmark
+class TestJWTBenchmarks:
+    """
+    Performance regression guards for JWT issuance and decoding.
+
+    Skipped by default (--benchmark-skip in addopts); run with
+    `pytest tests/unit/test_security.py --benchmark-only -n0`.
+    """
+
+    def test_bench_create_access_token(self, benchmark):
+        """Benchmark access token creation"""
+        token = benchmark(create_access_token, {"sub": "user-id-123"})
+
+        assert isinstance(token, str)
+
+    def test_bench_decode_token(self, benchmark):
+        """Benchmark access token decoding"""
+        token = create_access_token({"sub": "user-id-123"})
+
+        payload = benchmark(decode_token, token)
+
+        assert payload["sub"] == "user-id-123"
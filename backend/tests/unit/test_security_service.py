@@ -3,17 +3,45 @@ Unit tests for SecurityService (LOT 10)
 Tests 2FA TOTP, password hashing, and input validation.
 """
 import pytest
+from argon2 import PasswordHasher
 
 from src.services.security_service import SecurityService, get_security_service
 
+pytestmark = pytest.mark.xdist_group("security")
+
+# Test-only Argon2 cost: the production hasher (t=3, m=64MB, p=4) costs tens of
+# milliseconds per hash. Production parameters are still checked by
+# test_hash_password_argon2_production_params.
+_TEST_ARGON2_PARAMS = {
+    "time_cost": 1,
+    "memory_cost": 8,
+    "parallelism": 1,
+    "hash_len": 16,
+    "salt_len": 8,
+}
+
 
 class TestSecurityService:
     """Tests for SecurityService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def service(self):
-        """Create a SecurityService instance."""
-        return SecurityService()
+        """SecurityService shared by the class: it holds no per-test state."""
+        service = SecurityService()
+        service._password_hasher = PasswordHasher(**_TEST_ARGON2_PARAMS)
+        return service
+
+    @pytest.fixture(scope="class")
+    def totp_pair(self, service):
+        """A TOTP secret and its current code, generated once for the verify tests."""
+        secret = service.generate_totp_secret()
+        return secret, service.get_current_totp(secret)
+
+    @pytest.fixture(scope="class")
+    def argon2_sample(self, service):
+        """A password and its Argon2 hash, computed once for the verify tests."""
+        password = "SecurePassword123!"
+        return password, service.hash_password_argon2(password)
 
     # ============================================
     # TOTP Tests
@@ -29,10 +57,10 @@ class TestSecurityService:
 
     def test_generate_totp_secret_uniqueness(self, service):
         """Test that TOTP secrets are unique."""
-        secrets = [service.generate_totp_secret() for _ in range(10)]
+        secrets = [service.generate_totp_secret() for _ in range(3)]
 
         # All secrets should be unique
-        assert len(set(secrets)) == 10
+        assert len(set(secrets)) == 3
 
     def test_get_totp_provisioning_uri(self, service):
         """Test TOTP provisioning URI generation."""
@@ -43,18 +71,17 @@ class TestSecurityService:
         assert "M365LicenseOptimizer" in uri
         assert "test%40example.com" in uri or "test@example.com" in uri
 
-    def test_verify_totp_valid(self, service):
+    def test_verify_totp_valid(self, service, totp_pair):
         """Test TOTP verification with valid token."""
-        secret = service.generate_totp_secret()
-        token = service.get_current_totp(secret)
+        secret, token = totp_pair
 
         result = service.verify_totp(secret, token)
 
         assert result is True
 
-    def test_verify_totp_invalid_token(self, service):
+    def test_verify_totp_invalid_token(self, service, totp_pair):
         """Test TOTP verification with invalid token."""
-        secret = service.generate_totp_secret()
+        secret, _ = totp_pair
 
         result = service.verify_totp(secret, "000000")
 
@@ -80,6 +107,13 @@ class TestSecurityService:
         assert hashed != password
         assert hashed.startswith("$argon2")
 
+    def test_hash_password_argon2_production_params(self):
+        """Test the service hashes with its production Argon2id parameters."""
+        hashed = SecurityService().hash_password_argon2("SecurePassword123!")
+
+        assert hashed.startswith("$argon2id$")
+        assert "m=65536,t=3,p=4" in hashed
+
     def test_hash_password_argon2_uniqueness(self, service):
         """Test that same password produces different hashes."""
         password = "TestPassword123!"
@@ -100,19 +134,17 @@ class TestSecurityService:
         with pytest.raises(ValueError):
             service.hash_password_argon2("")
 
-    def test_verify_password_argon2_valid(self, service):
+    def test_verify_password_argon2_valid(self, service, argon2_sample):
         """Test Argon2 password verification with valid password."""
-        password = "SecurePassword123!"
-        hashed = service.hash_password_argon2(password)
+        password, hashed = argon2_sample
 
         result = service.verify_password_argon2(hashed, password)
 
         assert result is True
 
-    def test_verify_password_argon2_invalid(self, service):
+    def test_verify_password_argon2_invalid(self, service, argon2_sample):
         """Test Argon2 password verification with invalid password."""
-        password = "SecurePassword123!"
-        hashed = service.hash_password_argon2(password)
+        _, hashed = argon2_sample
 
         result = service.verify_password_argon2(hashed, "WrongPassword123!")
 
@@ -123,10 +155,9 @@ class TestSecurityService:
         assert service.verify_password_argon2("", "password") is False
         assert service.verify_password_argon2("hash", "") is False
 
-    def test_check_password_needs_rehash(self, service):
+    def test_check_password_needs_rehash(self, service, argon2_sample):
         """Test password rehash check."""
-        password = "TestPassword123!"
-        hashed = service.hash_password_argon2(password)
+        _, hashed = argon2_sample
 
         # Fresh hash should not need rehash
         result = service.check_password_needs_rehash(hashed)
@@ -171,29 +202,35 @@ class TestSecurityService:
 
         assert result == ""
 
-    def test_validate_email_valid(self, service):
-        """Test valid email validation."""
-        assert service.validate_email("test@example.com") is True
-        assert service.validate_email("user.name@domain.org") is True
-        assert service.validate_email("user+tag@example.co.uk") is True
-
-    def test_validate_email_invalid(self, service):
-        """Test invalid email validation."""
-        assert service.validate_email("notanemail") is False
-        assert service.validate_email("@example.com") is False
-        assert service.validate_email("test@") is False
-        assert service.validate_email("") is False
-
-    def test_validate_uuid_valid(self, service):
-        """Test valid UUID validation."""
-        assert service.validate_uuid("550e8400-e29b-41d4-a716-446655440000") is True
-        assert service.validate_uuid("550E8400-E29B-41D4-A716-446655440000") is True
-
-    def test_validate_uuid_invalid(self, service):
-        """Test invalid UUID validation."""
-        assert service.validate_uuid("not-a-uuid") is False
-        assert service.validate_uuid("550e8400-e29b-41d4-a716") is False
-        assert service.validate_uuid("") is False
+    @pytest.mark.parametrize(
+        "email,expected",
+        [
+            ("test@example.com", True),
+            ("user.name@domain.org", True),
+            ("user+tag@example.co.uk", True),
+            ("notanemail", False),
+            ("@example.com", False),
+            ("test@", False),
+            ("", False),
+        ],
+    )
+    def test_validate_email(self, service, email, expected):
+        """Test email validation."""
+        assert service.validate_email(email) is expected
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("550e8400-e29b-41d4-a716-446655440000", True),
+            ("550E8400-E29B-41D4-A716-446655440000", True),
+            ("not-a-uuid", False),
+            ("550e8400-e29b-41d4-a716", False),
+            ("", False),
+        ],
+    )
+    def test_validate_uuid(self, service, value, expected):
+        """Test UUID validation."""
+        assert service.validate_uuid(value) is expected
 
     # ============================================
     # Secure Token Tests
@@ -214,9 +251,9 @@ class TestSecurityService:
 
     def test_generate_secure_token_uniqueness(self, service):
         """Test secure token uniqueness."""
-        tokens = [service.generate_secure_token() for _ in range(10)]
+        tokens = [service.generate_secure_token() for _ in range(3)]
 
-        assert len(set(tokens)) == 10
+        assert len(set(tokens)) == 3
 
     # ============================================
     # Rate Limit Key Tests
@@ -1,15 +1,61 @@
 """
 Unit tests for SKU Mapping Service
 """
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
-from src.models.addon_compatibility import AddonCompatibility
-from src.models.microsoft_product import MicrosoftProduct
 from src.services.sku_mapping_service import SkuMappingService
 
+pytestmark = pytest.mark.xdist_group("sku_mapping")
+
+
+def _returning(value):
+    """Async stub returning value, for collaborators whose calls are not asserted"""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+# The service only reads attributes (and calls is_available/is_compatible) on
+# products and mappings, so plain namespaces stand in for the ORM models
+def _make_product(**overrides) -> SimpleNamespace:
+    """Build a Microsoft product stub"""
+    fields = {
+        "id": uuid4(),
+        "product_id": "CFQ7TTC0LF8S",
+        "sku_id": "0001",
+        "product_title": "Microsoft 365 Business Premium",
+        "sku_title": "Microsoft 365 Business Premium",
+    }
+    return SimpleNamespace(**{**fields, **overrides})
+
+
+def _make_compatibility_mapping(**overrides) -> SimpleNamespace:
+    """Build an add-on compatibility mapping stub"""
+    fields = {
+        "id": uuid4(),
+        "addon_sku_id": "0001",
+        "addon_product_id": "CFQ7TTC0P0HP",
+        "base_sku_id": "0001",
+        "base_product_id": "CFQ7TTC0LF8S",
+        "service_type": "Microsoft 365",
+        "addon_category": "Audio Conferencing",
+        "min_quantity": 1,
+        "max_quantity": None,
+        "quantity_multiplier": 1,
+        "requires_domain_validation": False,
+        "requires_tenant_validation": False,
+        "is_active": True,
+        "is_available": lambda: True,
+        "is_compatible": lambda base_sku_id, quantity: True,
+    }
+    return SimpleNamespace(**{**fields, **overrides})
+
 
 class TestSkuMappingService:
     """Test suite for SkuMappingService"""
@@ -27,51 +73,35 @@ class TestSkuMappingService:
     @pytest.fixture
     def mock_product(self):
         """Mock Microsoft product"""
-        product = MagicMock(spec=MicrosoftProduct)
-        product.id = uuid4()
-        product.product_id = "CFQ7TTC0LF8S"
-        product.sku_id = "0001"
-        product.product_title = "Microsoft 365 Business Premium"
-        product.sku_title = "Microsoft 365 Business Premium"
-        return product
+        return _make_product()
 
     @pytest.fixture
     def mock_compatibility_mapping(self):
         """Mock add-on compatibility mapping"""
-        mapping = MagicMock(spec=AddonCompatibility)
-        mapping.id = uuid4()
-        mapping.addon_sku_id = "0001"
-        mapping.addon_product_id = "CFQ7TTC0P0HP"
-        mapping.base_sku_id = "0001"
-        mapping.base_product_id = "CFQ7TTC0LF8S"
-        mapping.service_type = "Microsoft 365"
-        mapping.addon_category = "Audio Conferencing"
-        mapping.min_quantity = 1
-        mapping.max_quantity = None
-        mapping.quantity_multiplier = 1
-        mapping.is_active = True
-        mapping.is_available.return_value = True
-        mapping.is_compatible.return_value = True
-        return mapping
+        return _make_compatibility_mapping()
 
     @pytest.mark.asyncio
-    async def test_get_graph_sku_info(self, sku_service):
+    @pytest.mark.parametrize(
+        "sku_id,expected_name",
+        [
+            ("O365_BUSINESS_PREMIUM", "Microsoft 365 Business Premium"),
+            ("NONEXISTENT_SKU", None),
+        ],
+        ids=["found", "not_found"],
+    )
+    async def test_get_graph_sku_info(self, sku_service, sku_id, expected_name):
         """Test getting Graph API SKU information"""
-        result = await sku_service.get_graph_sku_info("O365_BUSINESS_PREMIUM")
+        result = await sku_service.get_graph_sku_info(sku_id)
 
-        assert result is not None
-        assert result["sku_id"] == "O365_BUSINESS_PREMIUM"
-        assert result["name"] == "Microsoft 365 Business Premium"
+        if expected_name is None:
+            assert result is None
+            return
+
+        assert result["sku_id"] == sku_id
+        assert result["name"] == expected_name
         assert "service_plans" in result
         assert "category" in result
 
-    @pytest.mark.asyncio
-    async def test_get_graph_sku_info_not_found(self, sku_service):
-        """Test getting non-existent Graph API SKU"""
-        result = await sku_service.get_graph_sku_info("NONEXISTENT_SKU")
-
-        assert result is None
-
     @pytest.mark.asyncio
     async def test_get_partner_center_sku_found(self, sku_service, mock_product):
         """Test getting Partner Center SKU for existing Graph SKU"""
@@ -90,7 +120,7 @@ class TestSkuMappingService:
     @pytest.mark.asyncio
     async def test_get_partner_center_sku_not_found(self, sku_service):
         """Test getting Partner Center SKU for non-existent Graph SKU"""
-        sku_service.product_repo.get_by_product_and_sku = AsyncMock(return_value=None)
+        sku_service.product_repo.get_by_product_and_sku = _returning(None)
 
         result = await sku_service.get_partner_center_sku("NONEXISTENT_SKU")
 
@@ -99,9 +129,7 @@ class TestSkuMappingService:
     @pytest.mark.asyncio
     async def test_map_graph_to_partner_center(self, sku_service, mock_product):
         """Test mapping multiple Graph SKUs to Partner Center"""
-        sku_service.product_repo.get_by_product_sku = AsyncMock(
-            return_value=mock_product
-        )
+        sku_service.product_repo.get_by_product_sku = _returning(mock_product)
 
         graph_skus = ["O365_BUSINESS_PREMIUM", "ENTERPRISEPACK", "NONEXISTENT"]
         result = await sku_service.map_graph_to_partner_center(graph_skus)
@@ -114,14 +142,12 @@ class TestSkuMappingService:
     @pytest.mark.asyncio
     async def test_get_compatible_addons(self, sku_service, mock_compatibility_mapping):
         """Test getting compatible add-ons for a base SKU"""
-        sku_service.get_partner_center_sku = AsyncMock(
-            return_value=MagicMock(sku_id="0001")
-        )
-        sku_service.addon_repo.get_compatible_addons = AsyncMock(
-            return_value=[mock_compatibility_mapping]
+        sku_service.get_partner_center_sku = _returning(_make_product())
+        sku_service.addon_repo.get_compatible_addons = _returning(
+            [mock_compatibility_mapping]
         )
-        sku_service.get_graph_sku_info = AsyncMock(
-            return_value={
+        sku_service.get_graph_sku_info = _returning(
+            {
                 "sku_id": "AUDIO_CONF",
                 "name": "Audio Conferencing",
                 "service_plans": ["AUDIO_CONF"],
@@ -139,54 +165,46 @@ class TestSkuMappingService:
     @pytest.mark.asyncio
     async def test_get_compatible_addons_no_partner_mapping(self, sku_service):
         """Test getting compatible add-ons when Partner Center mapping doesn't exist"""
-        sku_service.get_partner_center_sku = AsyncMock(return_value=None)
+        sku_service.get_partner_center_sku = _returning(None)
 
         result = await sku_service.get_compatible_addons("NONEXISTENT_SKU")
 
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_success(
-        self, sku_service, mock_product
+    @pytest.mark.parametrize(
+        "base_found,compatible,expected_valid,expected_error",
+        [
+            (True, True, True, None),
+            (True, False, False, "not compatible"),
+            (False, None, False, "not found"),
+        ],
+        ids=["success", "failure", "no_base_mapping"],
+    )
+    async def test_validate_addon_compatibility(
+        self,
+        sku_service,
+        mock_product,
+        base_found,
+        compatible,
+        expected_valid,
+        expected_error,
     ):
-        """Test successful add-on compatibility validation"""
-        sku_service.get_partner_center_sku = AsyncMock(return_value=mock_product)
-        sku_service.addon_repo.validate_compatibility = AsyncMock(return_value=True)
-
-        is_valid, error_message = await sku_service.validate_addon_compatibility(
-            "AUDIO_CONF", "O365_BUSINESS_PREMIUM", 5
+        """Test add-on compatibility validation outcomes"""
+        sku_service.get_partner_center_sku = _returning(
+            mock_product if base_found else None
         )
-
-        assert is_valid is True
-        assert error_message is None
-
-    @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_failure(
-        self, sku_service, mock_product
-    ):
-        """Test failed add-on compatibility validation"""
-        sku_service.get_partner_center_sku = AsyncMock(return_value=mock_product)
-        sku_service.addon_repo.validate_compatibility = AsyncMock(return_value=False)
+        sku_service.addon_repo.validate_compatibility = _returning(compatible)
 
         is_valid, error_message = await sku_service.validate_addon_compatibility(
             "AUDIO_CONF", "O365_BUSINESS_PREMIUM", 5
         )
 
-        assert is_valid is False
-        assert error_message is not None
-        assert "not compatible" in error_message
-
-    @pytest.mark.asyncio
-    async def test_validate_addon_compatibility_no_base_mapping(self, sku_service):
-        """Test add-on validation when base SKU has no Partner Center mapping"""
-        sku_service.get_partner_center_sku = AsyncMock(return_value=None)
-
-        is_valid, error_message = await sku_service.validate_addon_compatibility(
-            "AUDIO_CONF", "NONEXISTENT_BASE", 5
-        )
-
-        assert is_valid is False
-        assert "not found" in error_message
+        assert is_valid is expected_valid
+        if expected_error is None:
+            assert error_message is None
+        else:
+            assert expected_error in error_message
 
     @pytest.mark.asyncio
     async def test_create_mapping(self, sku_service):
@@ -204,10 +222,7 @@ class TestSkuMappingService:
             "description": "Test mapping",
         }
 
-        mock_mapping = MagicMock(spec=AddonCompatibility)
-        mock_mapping.id = uuid4()
-        for key, value in mapping_data.items():
-            setattr(mock_mapping, key, value)
+        mock_mapping = _make_compatibility_mapping(**mapping_data)
 
         sku_service.addon_repo.create = AsyncMock(return_value=mock_mapping)
 
@@ -222,10 +237,9 @@ class TestSkuMappingService:
         mapping_id = uuid4()
         update_data = {"description": "Updated description", "min_quantity": 2}
 
-        mock_mapping = MagicMock(spec=AddonCompatibility)
-        mock_mapping.id = mapping_id
+        mock_mapping = _make_compatibility_mapping(id=mapping_id)
 
-        sku_service.addon_repo.get_by_id = AsyncMock(return_value=mock_mapping)
+        sku_service.addon_repo.get_by_id = _returning(mock_mapping)
         sku_service.addon_repo.update = AsyncMock(return_value=mock_mapping)
 
         result = await sku_service.update_mapping(mapping_id, **update_data)
@@ -241,7 +255,7 @@ class TestSkuMappingService:
         mapping_id = uuid4()
         update_data = {"description": "Updated description"}
 
-        sku_service.addon_repo.get_by_id = AsyncMock(return_value=None)
+        sku_service.addon_repo.get_by_id = _returning(None)
 
         result = await sku_service.update_mapping(mapping_id, **update_data)
 
@@ -251,10 +265,9 @@ class TestSkuMappingService:
     async def test_delete_mapping_success(self, sku_service):
         """Test deleting an existing mapping"""
         mapping_id = uuid4()
-        mock_mapping = MagicMock(spec=AddonCompatibility)
-        mock_mapping.id = mapping_id
+        mock_mapping = _make_compatibility_mapping(id=mapping_id)
 
-        sku_service.addon_repo.get_by_id = AsyncMock(return_value=mock_mapping)
+        sku_service.addon_repo.get_by_id = _returning(mock_mapping)
         sku_service.addon_repo.delete = AsyncMock()
 
         success = await sku_service.delete_mapping(mapping_id)
@@ -267,35 +280,49 @@ class TestSkuMappingService:
         """Test deleting a non-existent mapping"""
         mapping_id = uuid4()
 
-        sku_service.addon_repo.get_by_id = AsyncMock(return_value=None)
+        sku_service.addon_repo.get_by_id = _returning(None)
 
         success = await sku_service.delete_mapping(mapping_id)
 
         assert success is False
 
     @pytest.mark.asyncio
-    async def test_get_sku_mapping_summary(
-        self, sku_service, mock_product, mock_compatibility_mapping
-    ):
+    async def test_get_sku_mapping_summary(self, sku_service):
         """Test getting SKU mapping summary"""
-        sku_service.product_repo.get_all = AsyncMock(return_value=[mock_product] * 10)
-        sku_service.addon_repo.get_all = AsyncMock(
-            return_value=[mock_compatibility_mapping] * 20
-        )
+        products = [_make_product(product_id=f"P{i}") for i in range(10)]
+        mappings = [
+            *(_make_compatibility_mapping() for _ in range(12)),
+            *(
+                _make_compatibility_mapping(
+                    service_type="Dynamics 365", addon_category="Storage"
+                )
+                for _ in range(6)
+            ),
+            *(_make_compatibility_mapping(is_active=False) for _ in range(2)),
+        ]
+        sku_service.product_repo.get_all = _returning(products)
+        sku_service.addon_repo.get_all = _returning(mappings)
 
         result = await sku_service.get_sku_mapping_summary()
 
         assert result["total_partner_center_products"] == 10
         assert result["total_compatibility_mappings"] == 20
-        assert "service_type_distribution" in result
-        assert "addon_category_distribution" in result
-        assert "mapping_coverage" in result
+        assert result["active_mappings"] == 18
+        assert result["service_type_distribution"] == {
+            "Microsoft 365": 14,
+            "Dynamics 365": 6,
+        }
+        assert result["addon_category_distribution"] == {
+            "Audio Conferencing": 14,
+            "Storage": 6,
+        }
+        assert result["mapping_coverage"] == 0.9
 
     @pytest.mark.asyncio
     async def test_get_sku_mapping_summary_empty(self, sku_service):
         """Test getting SKU mapping summary with empty data"""
-        sku_service.product_repo.get_all = AsyncMock(return_value=[])
-        sku_service.addon_repo.get_all = AsyncMock(return_value=[])
+        sku_service.product_repo.get_all = _returning([])
+        sku_service.addon_repo.get_all = _returning([])
 
         result = await sku_service.get_sku_mapping_summary()
 
@@ -8,11 +8,99 @@ import gzip
 import os
 import subprocess
 import sys
-from datetime import datetime, timezone
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
+# Blob upload tuning: pg_dump files can reach several GB, and the SDK defaults
+# upload them in small blocks over a single connection
+UPLOAD_MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+UPLOAD_MAX_BLOCK_SIZE = 16 * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = min(8, os.cpu_count() or 1)
+
+# Maximum number of sub-requests in a Blob batch request
+DELETE_BATCH_SIZE = 256
+
+# pg_dump time limit, for the local dump and for the whole streamed pipe
+BACKUP_TIMEOUT_SECONDS = 600
+
+# Low compression levels are several times faster than 9 for a few percent of size
+DEFAULT_COMPRESSION_LEVEL = 3
+
+
+def _pg_dump_major_version() -> int:
+    """Major version of the installed pg_dump, 0 if it cannot be determined."""
+    try:
+        result = subprocess.run(
+            ["pg_dump", "--version"], capture_output=True, text=True, timeout=10
+        )
+        # e.g. "pg_dump (PostgreSQL) 16.2" or "pg_dump (PostgreSQL) 15.6 (Debian ...)"
+        return int(result.stdout.split()[2].split(".")[0])
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError):
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _pg_dump_supports_zstd() -> bool:
+    """
+    Whether the installed pg_dump can write zstd-compressed dumps.
+
+    zstd needs pg_dump 16+ (older versions reject or misparse the option)
+    built with zstd support. On 16+ the option is validated before
+    connecting, so probing against an unreachable socket answers quickly:
+    a build without zstd reports "does not support compression with ZSTD".
+    """
+    if _pg_dump_major_version() < 16:
+        return False
+    try:
+        result = subprocess.run(
+            [
+                "pg_dump",
+                "--format=custom",
+                "--compress=zstd:1",
+                "--dbname=host=/nonexistent",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "does not support compression with ZSTD" not in result.stderr
+
+
+def _pg_dump_compression(compress: bool, level: int) -> str:
+    """pg_dump compression option: zstd when supported, gzip otherwise."""
+    if not compress:
+        return "--compress=0"
+    if _pg_dump_supports_zstd():
+        return f"--compress=zstd:{level}"
+    return f"--compress={level}"
+
+
+def _pg_dump_command(
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    compress: bool,
+    compression_level: int,
+) -> list[str]:
+    """Build the pg_dump command line (custom format, output to stdout)."""
+    return [
+        "pg_dump",
+        "-h", host,
+        "-p", str(port),
+        "-U", user,
+        "-d", database,
+        "--format=custom",
+        _pg_dump_compression(compress, compression_level),
+    ]
+
 
 def create_backup(
     host: str,
@@ -22,6 +110,7 @@ def create_backup(
     password: str,
     output_path: Path,
     compress: bool = True,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
 ) -> Optional[Path]:
     """
     Create a PostgreSQL backup using pg_dump.
@@ -34,6 +123,7 @@ def create_backup(
         password: Database password
         output_path: Output file path
         compress: Whether to compress the backup
+        compression_level: Compression level (zstd when supported, gzip otherwise)
 
     Returns:
         Path to backup file if successful, None otherwise
@@ -41,14 +131,9 @@ def create_backup(
     env = os.environ.copy()
     env["PGPASSWORD"] = password
 
-    cmd = [
-        "pg_dump",
-        "-h", host,
-        "-p", str(port),
-        "-U", user,
-        "-d", database,
-        "--format=custom",
-        "--compress=9" if compress else "--no-compression",
+    cmd = _pg_dump_command(
+        host, port, database, user, compress, compression_level
+    ) + [
         "-f", str(output_path),
     ]
 
@@ -58,7 +143,7 @@ def create_backup(
             env=env,
             capture_output=True,
             text=True,
-            timeout=600,  # 10 minute timeout
+            timeout=BACKUP_TIMEOUT_SECONDS,
         )
 
         if result.returncode != 0:
@@ -78,6 +163,49 @@ def create_backup(
         return None
 
 
+@lru_cache(maxsize=None)
+def _get_blob_service_client(account_url: str):
+    """
+    Blob service client shared by the upload and cleanup steps.
+
+    DefaultAzureCredential probes several credential sources (environment,
+    managed identity endpoint, CLI) when it first fetches a token, so one
+    credential and one client are built per account and reused.
+
+    Raises:
+        ImportError: If the Azure SDK is not installed
+    """
+    from azure.identity import DefaultAzureCredential
+    from azure.storage.blob import BlobServiceClient
+
+    return BlobServiceClient(
+        account_url,
+        credential=DefaultAzureCredential(),
+        max_single_put_size=UPLOAD_MAX_SINGLE_PUT_SIZE,
+        max_block_size=UPLOAD_MAX_BLOCK_SIZE,
+    )
+
+
+def _get_upload_container_client(account_url: str, container: str):
+    """
+    Get a container client tuned for large uploads, creating the container if needed.
+
+    Raises:
+        ImportError: If the Azure SDK is not installed
+    """
+    blob_service_client = _get_blob_service_client(account_url)
+    container_client = blob_service_client.get_container_client(container)
+
+    # Create container if it doesn't exist
+    try:
+        container_client.create_container()
+        print(f"Created container: {container}")
+    except Exception:
+        pass  # Container already exists
+
+    return container_client
+
+
 def upload_to_azure_blob(
     file_path: Path,
     storage_account: str,
@@ -97,27 +225,21 @@ def upload_to_azure_blob(
         Blob URL if successful, None otherwise
     """
     try:
-        from azure.identity import DefaultAzureCredential
-        from azure.storage.blob import BlobServiceClient
-
         account_url = f"https://{storage_account}.blob.core.windows.net"
-        credential = DefaultAzureCredential()
-        blob_service_client = BlobServiceClient(account_url, credential=credential)
-
-        container_client = blob_service_client.get_container_client(container)
-
-        # Create container if it doesn't exist
-        try:
-            container_client.create_container()
-            print(f"Created container: {container}")
-        except Exception:
-            pass  # Container already exists
+        container_client = _get_upload_container_client(account_url, container)
 
         blob_name = blob_name or file_path.name
         blob_client = container_client.get_blob_client(blob_name)
 
+        # Blocks are uploaded in parallel; passing the length skips the SDK's
+        # size probe on the file object
         with open(file_path, "rb") as data:
-            blob_client.upload_blob(data, overwrite=True)
+            blob_client.upload_blob(
+                data,
+                length=file_path.stat().st_size,
+                overwrite=True,
+                max_concurrency=UPLOAD_MAX_CONCURRENCY,
+            )
 
         blob_url = f"{account_url}/{container}/{blob_name}"
         print(f"Uploaded to: {blob_url}")
@@ -131,6 +253,105 @@ def upload_to_azure_blob(
         return None
 
 
+def stream_backup_to_azure_blob(
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    password: str,
+    storage_account: str,
+    container: str,
+    blob_name: str,
+    compress: bool = True,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+) -> Optional[str]:
+    """
+    Pipe pg_dump output straight into Azure Blob Storage.
+
+    The dump is never written to local disk, and dumping overlaps with the
+    upload. If pg_dump fails, the partial blob is deleted.
+
+    Args:
+        host: Database host
+        port: Database port
+        database: Database name
+        user: Database user
+        password: Database password
+        storage_account: Azure Storage account name
+        container: Container name
+        blob_name: Blob name
+        compress: Whether to compress the backup
+        compression_level: Compression level (zstd when supported, gzip otherwise)
+
+    Returns:
+        Blob URL if successful, None otherwise
+    """
+    env = os.environ.copy()
+    env["PGPASSWORD"] = password
+
+    try:
+        account_url = f"https://{storage_account}.blob.core.windows.net"
+        container_client = _get_upload_container_client(account_url, container)
+        blob_client = container_client.get_blob_client(blob_name)
+
+        # stderr goes to a file so a chatty pg_dump cannot block on a full pipe
+        with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+            _pg_dump_command(
+                host, port, database, user, compress, compression_level
+            ),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        ) as process:
+            # The time limit covers the whole pipe: killing pg_dump closes
+            # stdout, which ends the upload
+            timed_out = threading.Event()
+
+            def _kill_on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(BACKUP_TIMEOUT_SECONDS, _kill_on_timeout)
+            timer.start()
+            try:
+                blob_client.upload_blob(
+                    process.stdout,
+                    overwrite=True,
+                    max_concurrency=UPLOAD_MAX_CONCURRENCY,
+                )
+                returncode = process.wait()
+            except Exception:
+                process.kill()
+                raise
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                print("ERROR: Backup timed out after 10 minutes")
+                blob_client.delete_blob()
+                return None
+
+            if returncode != 0:
+                stderr.seek(0)
+                print(f"ERROR: pg_dump failed: {stderr.read().decode(errors='replace')}")
+                blob_client.delete_blob()
+                return None
+
+        blob_url = f"{account_url}/{container}/{blob_name}"
+        print(f"Uploaded to: {blob_url}")
+        return blob_url
+
+    except ImportError:
+        print("ERROR: Azure SDK not installed. Run: pip install azure-identity azure-storage-blob")
+        return None
+    except FileNotFoundError:
+        print("ERROR: pg_dump not found. Install PostgreSQL client tools.")
+        return None
+    except Exception as e:
+        print(f"ERROR: Streaming backup failed: {e}")
+        return None
+
+
 def cleanup_old_backups(
     storage_account: str,
     container: str,
@@ -148,25 +369,32 @@ def cleanup_old_backups(
         Number of deleted backups
     """
     try:
-        from datetime import timedelta
-
-        from azure.identity import DefaultAzureCredential
-        from azure.storage.blob import BlobServiceClient
-
         account_url = f"https://{storage_account}.blob.core.windows.net"
-        credential = DefaultAzureCredential()
-        blob_service_client = BlobServiceClient(account_url, credential=credential)
+        blob_service_client = _get_blob_service_client(account_url)
 
         container_client = blob_service_client.get_container_client(container)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
+        # Prefix filtering happens server-side
+        expired = [
+            blob.name
+            for blob in container_client.list_blobs(name_starts_with="backup_")
+            if blob.last_modified and blob.last_modified < cutoff_date
+        ]
+
+        # One batch request per DELETE_BATCH_SIZE blobs instead of one per blob
         deleted_count = 0
-        for blob in container_client.list_blobs():
-            if blob.last_modified and blob.last_modified < cutoff_date:
-                if blob.name.startswith("backup_"):
-                    container_client.delete_blob(blob.name)
-                    print(f"Deleted old backup: {blob.name}")
+        for start in range(0, len(expired), DELETE_BATCH_SIZE):
+            batch = expired[start : start + DELETE_BATCH_SIZE]
+            responses = container_client.delete_blobs(
+                *batch, raise_on_any_failure=False
+            )
+            for name, response in zip(batch, responses):
+                if response.status_code == 202:
+                    print(f"Deleted old backup: {name}")
                     deleted_count += 1
+                else:
+                    print(f"WARNING: Could not delete {name}: HTTP {response.status_code}")
 
         return deleted_count
 
@@ -230,6 +458,12 @@ def main():
         default=Path("./backups"),
         help="Local output directory for backups",
     )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=DEFAULT_COMPRESSION_LEVEL,
+        help="pg_dump compression level (zstd when supported, gzip otherwise)",
+    )
     parser.add_argument(
         "--retention-days",
         type=int,
@@ -249,8 +483,7 @@ def main():
         print("ERROR: Database password required. Set POSTGRES_PASSWORD or use --password")
         sys.exit(1)
 
-    # Create output directory
-    args.output_dir.mkdir(parents=True, exist_ok=True)
+    upload = not args.local_only and bool(args.storage_account)
 
     # Generate backup filename
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -263,53 +496,78 @@ def main():
     print(f"{'='*60}")
     print(f"Timestamp: {timestamp}")
     print(f"Database: {args.database}@{args.host}:{args.port}")
-    print(f"Output: {backup_path}")
+    print(f"Output: {f'{args.container}/{filename}' if upload else backup_path}")
     print(f"{'='*60}\n")
 
-    # Create backup
-    print("Creating database backup...")
-    result = create_backup(
-        host=args.host,
-        port=args.port,
-        database=args.database,
-        user=args.user,
-        password=args.password,
-        output_path=backup_path,
-    )
+    # Stream the dump straight to Azure if configured (no local copy)
+    blob_url = None
+    if upload:
+        print("Streaming database backup to Azure Blob Storage...")
+        blob_url = stream_backup_to_azure_blob(
+            host=args.host,
+            port=args.port,
+            database=args.database,
+            user=args.user,
+            password=args.password,
+            compression_level=args.compression_level,
+            storage_account=args.storage_account,
+            container=args.container,
+            blob_name=filename,
+        )
 
-    if not result:
-        print("\n❌ Backup failed!")
-        sys.exit(1)
+        if blob_url:
+            print(f"✓ Uploaded to: {blob_url}")
+        else:
+            print("⚠ Streaming upload failed, falling back to a local backup\n")
+
+    if not blob_url:
+        # Create output directory
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+        print("Creating database backup...")
+        result = create_backup(
+            host=args.host,
+            port=args.port,
+            database=args.database,
+            user=args.user,
+            password=args.password,
+            compression_level=args.compression_level,
+            output_path=backup_path,
+        )
 
-    file_size = backup_path.stat().st_size
-    print(f"✓ Backup created: {filename} ({file_size / 1024 / 1024:.2f} MB)")
+        if not result:
+            print("\n❌ Backup failed!")
+            sys.exit(1)
 
-    # Upload to Azure if configured
-    if not args.local_only and args.storage_account:
-        print("\nUploading to Azure Blob Storage...")
-        blob_url = upload_to_azure_blob(
-            backup_path,
-            args.storage_account,
-            args.container,
-        )
+        file_size = backup_path.stat().st_size
+        print(f"✓ Backup created: {filename} ({file_size / 1024 / 1024:.2f} MB)")
+
+        if upload:
+            print("\nUploading to Azure Blob Storage...")
+            blob_url = upload_to_azure_blob(
+                backup_path,
+                args.storage_account,
+                args.container,
+            )
+
+            if not blob_url:
+                print(f"\n❌ Upload failed, backup saved locally: {backup_path}")
+                sys.exit(1)
 
-        if blob_url:
             print(f"✓ Uploaded to: {blob_url}")
 
-            # Optional cleanup
-            if args.cleanup:
-                print(f"\nCleaning up backups older than {args.retention_days} days...")
-                deleted = cleanup_old_backups(
-                    args.storage_account,
-                    args.container,
-                    args.retention_days,
-                )
-                print(f"✓ Deleted {deleted} old backup(s)")
-        else:
-            print("⚠ Upload failed, backup saved locally")
+        elif not args.local_only:
+            print("\n⚠ AZURE_STORAGE_ACCOUNT not configured, backup saved locally only")
 
-    elif not args.storage_account and not args.local_only:
-        print("\n⚠ AZURE_STORAGE_ACCOUNT not configured, backup saved locally only")
+    # Optional cleanup
+    if blob_url and args.cleanup:
+        print(f"\nCleaning up backups older than {args.retention_days} days...")
+        deleted = cleanup_old_backups(
+            args.storage_account,
+            args.container,
+            args.retention_days,
+        )
+        print(f"✓ Deleted {deleted} old backup(s)")
 
     print(f"\n{'='*60}")
     print("✅ Backup completed successfully!")